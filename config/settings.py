@@ -4,10 +4,16 @@ Centralized settings management with environment variable support.
 """
 import os
 import json
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Optional, ClassVar, Mapping
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON serializer
+    orjson = None
+
 class BrowserType(Enum):
     """Supported browser types"""
     CHROME = "chrome"
@@ -23,128 +29,228 @@ class EnvironmentType(Enum):
     STAGING = "staging"
     PROD = "prod"
 
-@dataclass
+# Environment variables read by TestSettings
+_KNOWN_KEYS = (
+    "ENVIRONMENT", "BASE_URL", "API_URL", "BROWSER", "HEADLESS", "BROWSER_TIMEOUT",
+    "IMPLICIT_WAIT", "EXPLICIT_WAIT", "WINDOW_WIDTH", "WINDOW_HEIGHT",
+    "SELENIUM_HUB_URL", "ENABLE_GRID", "API_TIMEOUT", "API_RETRIES", "ADMIN_USERNAME",
+    "ADMIN_PASSWORD", "TEST_TIMEOUT", "PARALLEL_EXECUTION", "MAX_PARALLEL_WORKERS",
+    "MAX_RETRIES", "RETRY_DELAY", "SCREENSHOT_ON_FAILURE", "SCREENSHOT_DIR",
+    "VIDEO_ON_FAILURE", "VIDEO_DIR", "REPORT_DIR", "REPORT_FORMAT", "ALLURE_REPORT",
+    "LOG_LEVEL", "LOG_DIR", "LOG_FORMAT", "PAGE_LOAD_TIMEOUT", "SCRIPT_TIMEOUT",
+    "SECURITY_SCAN", "SSL_VERIFICATION", "DB_HOST", "DB_PORT", "DB_NAME", "DB_USER",
+    "DB_PASSWORD", "ENABLE_NOTIFICATIONS", "NOTIFICATION_EMAIL", "SLACK_WEBHOOK",
+    "TEST_DATA_DIR", "USE_FAKE_DATA", "CLEAR_CACHE_BEFORE_TEST",
+    "CLEAR_COOKIES_BEFORE_TEST", "MOBILE_EMULATION", "MOBILE_DEVICE",
+)
+
+
+def _snapshot_env() -> Dict[str, Optional[str]]:
+    """Take a one-off snapshot of the known environment variables"""
+    return {key: os.environ.get(key) for key in _KNOWN_KEYS}
+
+
+# Environment snapshot taken once at import; see reload_env()
+_ENV_SNAPSHOT = _snapshot_env()
+
+
+def reload_env():
+    """Rebuild the environment snapshot after tests mutate os.environ"""
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = _snapshot_env()
+
+
+def _env(key: str, default: str) -> str:
+    """Get a string value from the environment snapshot"""
+    value = _ENV_SNAPSHOT.get(key)
+    return default if value is None else value
+
+
+def _int_env(key: str, default: int) -> int:
+    """Get an integer value from the environment snapshot"""
+    value = _ENV_SNAPSHOT.get(key)
+    return default if value is None else int(value)
+
+
+def _bool_env(key: str, default: bool) -> bool:
+    """Get a boolean value from the environment snapshot"""
+    value = _ENV_SNAPSHOT.get(key)
+    return default if value is None else value.lower() == "true"
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Environment-specific configuration, built once at import
+_ENV_CONFIGS = MappingProxyType({
+    EnvironmentType.DEV: MappingProxyType({
+        "base_url": "http://localhost:8080",
+        "api_url": "http://localhost:3000",
+        "headless": False,
+        "log_level": "DEBUG"
+    }),
+    EnvironmentType.QA: MappingProxyType({
+        "base_url": "https://qa.example.com",
+        "api_url": "https://qa-api.example.com",
+        "headless": True,
+        "log_level": "INFO"
+    }),
+    EnvironmentType.STAGING: MappingProxyType({
+        "base_url": "https://staging.example.com",
+        "api_url": "https://staging-api.example.com",
+        "headless": True,
+        "log_level": "INFO"
+    }),
+    EnvironmentType.PROD: MappingProxyType({
+        "base_url": "https://example.com",
+        "api_url": "https://api.example.com",
+        "headless": True,
+        "log_level": "WARNING"
+    })
+})
+
+# Static parts of the browser capabilities; window size and headless
+# flags are filled in per call by get_browser_capabilities(), which
+# returns plain dicts so the result stays JSON-serializable for drivers
+_CHROME_BASE_ARGS = ("--no-sandbox", "--disable-dev-shm-usage")
+_CHROME_CAPABILITIES = MappingProxyType({
+    "browserName": "chrome",
+    "version": "latest",
+    "platform": "ANY"
+})
+_CHROME_LOGGING_PREFS = MappingProxyType({"browser": "ALL", "performance": "ALL"})
+_BROWSER_CAPABILITIES = MappingProxyType({
+    BrowserType.EDGE: MappingProxyType({
+        "browserName": "MicrosoftEdge",
+        "version": "latest"
+    })
+})
+
+
+@dataclass(slots=True, frozen=True)
 class TestSettings:
     """
     Centralized test settings configuration.
     Supports environment-specific configurations.
     """
     
+    # Populated once after the class body; see below
+    _FIELD_NAMES: ClassVar[frozenset] = frozenset()
+    
     # Environment Settings
     environment: EnvironmentType = field(
-        default_factory=lambda: EnvironmentType(os.getenv("ENVIRONMENT", "qa"))
+        default_factory=lambda: EnvironmentType(_env("ENVIRONMENT", "qa"))
     )
     
     # Application URLs
     base_url: str = field(
-        default_factory=lambda: os.getenv("BASE_URL", "https://demo.testfire.net")
+        default_factory=lambda: _env("BASE_URL", "https://demo.testfire.net")
     )
     api_url: str = field(
-        default_factory=lambda: os.getenv("API_URL", "https://jsonplaceholder.typicode.com")
+        default_factory=lambda: _env("API_URL", "https://jsonplaceholder.typicode.com")
     )
     
     # Browser Configuration
     browser: BrowserType = field(
-        default_factory=lambda: BrowserType(os.getenv("BROWSER", "chrome"))
+        default_factory=lambda: BrowserType(_env("BROWSER", "chrome"))
     )
     headless: bool = field(
-        default_factory=lambda: os.getenv("HEADLESS", "true").lower() == "true"
+        default_factory=lambda: _bool_env("HEADLESS", True)
     )
     browser_timeout: int = field(
-        default_factory=lambda: int(os.getenv("BROWSER_TIMEOUT", "30"))
+        default_factory=lambda: _int_env("BROWSER_TIMEOUT", 30)
     )
     implicit_wait: int = field(
-        default_factory=lambda: int(os.getenv("IMPLICIT_WAIT", "10"))
+        default_factory=lambda: _int_env("IMPLICIT_WAIT", 10)
     )
     explicit_wait: int = field(
-        default_factory=lambda: int(os.getenv("EXPLICIT_WAIT", "30"))
+        default_factory=lambda: _int_env("EXPLICIT_WAIT", 30)
     )
     
     # Window/Viewport Settings
     window_width: int = field(
-        default_factory=lambda: int(os.getenv("WINDOW_WIDTH", "1920"))
+        default_factory=lambda: _int_env("WINDOW_WIDTH", 1920)
     )
     window_height: int = field(
-        default_factory=lambda: int(os.getenv("WINDOW_HEIGHT", "1080"))
+        default_factory=lambda: _int_env("WINDOW_HEIGHT", 1080)
     )
     
     # Selenium Grid Configuration
     selenium_hub_url: str = field(
-        default_factory=lambda: os.getenv("SELENIUM_HUB_URL", "http://localhost:4444/wd/hub")
+        default_factory=lambda: _env("SELENIUM_HUB_URL", "http://localhost:4444/wd/hub")
     )
     enable_grid: bool = field(
-        default_factory=lambda: os.getenv("ENABLE_GRID", "false").lower() == "true"
+        default_factory=lambda: _bool_env("ENABLE_GRID", False)
     )
     
     # API Configuration
     api_timeout: int = field(
-        default_factory=lambda: int(os.getenv("API_TIMEOUT", "30"))
+        default_factory=lambda: _int_env("API_TIMEOUT", 30)
     )
     api_retries: int = field(
-        default_factory=lambda: int(os.getenv("API_RETRIES", "3"))
+        default_factory=lambda: _int_env("API_RETRIES", 3)
     )
     
     # Authentication
     admin_username: str = field(
-        default_factory=lambda: os.getenv("ADMIN_USERNAME", "admin")
+        default_factory=lambda: _env("ADMIN_USERNAME", "admin")
     )
     admin_password: str = field(
-        default_factory=lambda: os.getenv("ADMIN_PASSWORD", "admin123")
+        default_factory=lambda: _env("ADMIN_PASSWORD", "admin123")
     )
     
     # Test Execution Settings
     test_timeout: int = field(
-        default_factory=lambda: int(os.getenv("TEST_TIMEOUT", "300"))
+        default_factory=lambda: _int_env("TEST_TIMEOUT", 300)
     )
     parallel_execution: bool = field(
-        default_factory=lambda: os.getenv("PARALLEL_EXECUTION", "true").lower() == "true"
+        default_factory=lambda: _bool_env("PARALLEL_EXECUTION", True)
     )
     max_parallel_workers: int = field(
-        default_factory=lambda: int(os.getenv("MAX_PARALLEL_WORKERS", "4"))
+        default_factory=lambda: _int_env("MAX_PARALLEL_WORKERS", 4)
     )
     
     # Retry Configuration
     max_retries: int = field(
-        default_factory=lambda: int(os.getenv("MAX_RETRIES", "3"))
+        default_factory=lambda: _int_env("MAX_RETRIES", 3)
     )
     retry_delay: int = field(
-        default_factory=lambda: int(os.getenv("RETRY_DELAY", "2"))
+        default_factory=lambda: _int_env("RETRY_DELAY", 2)
     )
     
     # Screenshot and Video Settings
     screenshot_on_failure: bool = field(
-        default_factory=lambda: os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+        default_factory=lambda: _bool_env("SCREENSHOT_ON_FAILURE", True)
     )
     screenshot_dir: str = field(
-        default_factory=lambda: os.getenv("SCREENSHOT_DIR", "reports/screenshots")
+        default_factory=lambda: _env("SCREENSHOT_DIR", "reports/screenshots")
     )
     video_on_failure: bool = field(
-        default_factory=lambda: os.getenv("VIDEO_ON_FAILURE", "false").lower() == "true"
+        default_factory=lambda: _bool_env("VIDEO_ON_FAILURE", False)
     )
     video_dir: str = field(
-        default_factory=lambda: os.getenv("VIDEO_DIR", "reports/videos")
+        default_factory=lambda: _env("VIDEO_DIR", "reports/videos")
     )
     
     # Reporting Settings
     report_dir: str = field(
-        default_factory=lambda: os.getenv("REPORT_DIR", "reports")
+        default_factory=lambda: _env("REPORT_DIR", "reports")
     )
     report_format: str = field(
-        default_factory=lambda: os.getenv("REPORT_FORMAT", "html")
+        default_factory=lambda: _env("REPORT_FORMAT", "html")
     )
     allure_report: bool = field(
-        default_factory=lambda: os.getenv("ALLURE_REPORT", "true").lower() == "true"
+        default_factory=lambda: _bool_env("ALLURE_REPORT", True)
     )
     
     # Logging Settings
     log_level: str = field(
-        default_factory=lambda: os.getenv("LOG_LEVEL", "INFO")
+        default_factory=lambda: _env("LOG_LEVEL", "INFO")
     )
     log_dir: str = field(
-        default_factory=lambda: os.getenv("LOG_DIR", "logs")
+        default_factory=lambda: _env("LOG_DIR", "logs")
     )
     log_format: str = field(
-        default_factory=lambda: os.getenv(
+        default_factory=lambda: _env(
             "LOG_FORMAT",
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
@@ -152,132 +258,98 @@ class TestSettings:
     
     # Performance Settings
     page_load_timeout: int = field(
-        default_factory=lambda: int(os.getenv("PAGE_LOAD_TIMEOUT", "60"))
+        default_factory=lambda: _int_env("PAGE_LOAD_TIMEOUT", 60)
     )
     script_timeout: int = field(
-        default_factory=lambda: int(os.getenv("SCRIPT_TIMEOUT", "30"))
+        default_factory=lambda: _int_env("SCRIPT_TIMEOUT", 30)
     )
     
     # Security Settings
     security_scan: bool = field(
-        default_factory=lambda: os.getenv("SECURITY_SCAN", "true").lower() == "true"
+        default_factory=lambda: _bool_env("SECURITY_SCAN", True)
     )
     ssl_verification: bool = field(
-        default_factory=lambda: os.getenv("SSL_VERIFICATION", "true").lower() == "true"
+        default_factory=lambda: _bool_env("SSL_VERIFICATION", True)
     )
     
     # Database Settings (if applicable)
     db_host: str = field(
-        default_factory=lambda: os.getenv("DB_HOST", "localhost")
+        default_factory=lambda: _env("DB_HOST", "localhost")
     )
     db_port: int = field(
-        default_factory=lambda: int(os.getenv("DB_PORT", "5432"))
+        default_factory=lambda: _int_env("DB_PORT", 5432)
     )
     db_name: str = field(
-        default_factory=lambda: os.getenv("DB_NAME", "test_db")
+        default_factory=lambda: _env("DB_NAME", "test_db")
     )
     db_user: str = field(
-        default_factory=lambda: os.getenv("DB_USER", "test_user")
+        default_factory=lambda: _env("DB_USER", "test_user")
     )
     db_password: str = field(
-        default_factory=lambda: os.getenv("DB_PASSWORD", "")
+        default_factory=lambda: _env("DB_PASSWORD", "")
     )
     
     # Email/Slack Notifications
     enable_notifications: bool = field(
-        default_factory=lambda: os.getenv("ENABLE_NOTIFICATIONS", "false").lower() == "true"
+        default_factory=lambda: _bool_env("ENABLE_NOTIFICATIONS", False)
     )
     notification_email: str = field(
-        default_factory=lambda: os.getenv("NOTIFICATION_EMAIL", "")
+        default_factory=lambda: _env("NOTIFICATION_EMAIL", "")
     )
     slack_webhook: str = field(
-        default_factory=lambda: os.getenv("SLACK_WEBHOOK", "")
+        default_factory=lambda: _env("SLACK_WEBHOOK", "")
     )
     
     # Test Data Settings
     test_data_dir: str = field(
-        default_factory=lambda: os.getenv("TEST_DATA_DIR", "test_data")
+        default_factory=lambda: _env("TEST_DATA_DIR", "test_data")
     )
     use_fake_data: bool = field(
-        default_factory=lambda: os.getenv("USE_FAKE_DATA", "true").lower() == "true"
+        default_factory=lambda: _bool_env("USE_FAKE_DATA", True)
     )
     
     # Cache Settings
     clear_cache_before_test: bool = field(
-        default_factory=lambda: os.getenv("CLEAR_CACHE_BEFORE_TEST", "true").lower() == "true"
+        default_factory=lambda: _bool_env("CLEAR_CACHE_BEFORE_TEST", True)
     )
     clear_cookies_before_test: bool = field(
-        default_factory=lambda: os.getenv("CLEAR_COOKIES_BEFORE_TEST", "true").lower() == "true"
+        default_factory=lambda: _bool_env("CLEAR_COOKIES_BEFORE_TEST", True)
     )
     
     # Mobile Testing
     mobile_emulation: bool = field(
-        default_factory=lambda: os.getenv("MOBILE_EMULATION", "false").lower() == "true"
+        default_factory=lambda: _bool_env("MOBILE_EMULATION", False)
     )
     mobile_device: str = field(
-        default_factory=lambda: os.getenv("MOBILE_DEVICE", "iPhone 12")
+        default_factory=lambda: _env("MOBILE_DEVICE", "iPhone 12")
     )
     
-    def get_environment_config(self) -> Dict[str, Any]:
+    def get_environment_config(self) -> Mapping[str, Any]:
         """Get environment-specific configuration"""
-        env_configs = {
-            EnvironmentType.DEV: {
-                "base_url": "http://localhost:8080",
-                "api_url": "http://localhost:3000",
-                "headless": False,
-                "log_level": "DEBUG"
-            },
-            EnvironmentType.QA: {
-                "base_url": "https://qa.example.com",
-                "api_url": "https://qa-api.example.com",
-                "headless": True,
-                "log_level": "INFO"
-            },
-            EnvironmentType.STAGING: {
-                "base_url": "https://staging.example.com",
-                "api_url": "https://staging-api.example.com",
-                "headless": True,
-                "log_level": "INFO"
-            },
-            EnvironmentType.PROD: {
-                "base_url": "https://example.com",
-                "api_url": "https://api.example.com",
-                "headless": True,
-                "log_level": "WARNING"
-            }
-        }
-        
-        return env_configs.get(self.environment, {})
+        return _ENV_CONFIGS.get(self.environment, _EMPTY)
     
     def get_browser_capabilities(self) -> Dict[str, Any]:
         """Get browser-specific capabilities"""
-        capabilities = {
-            BrowserType.CHROME: {
-                "browserName": "chrome",
-                "version": "latest",
-                "platform": "ANY",
-                "goog:loggingPrefs": {"browser": "ALL", "performance": "ALL"},
+        if self.browser == BrowserType.CHROME:
+            return {
+                **_CHROME_CAPABILITIES,
+                "goog:loggingPrefs": dict(_CHROME_LOGGING_PREFS),
                 "chromeOptions": {
                     "args": [
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
+                        *_CHROME_BASE_ARGS,
                         f"--window-size={self.window_width},{self.window_height}"
                     ]
                 }
-            },
-            BrowserType.FIREFOX: {
+            }
+        if self.browser == BrowserType.FIREFOX:
+            return {
                 "browserName": "firefox",
                 "moz:firefoxOptions": {
                     "args": ["-headless"] if self.headless else []
                 }
-            },
-            BrowserType.EDGE: {
-                "browserName": "MicrosoftEdge",
-                "version": "latest"
             }
-        }
         
-        return capabilities.get(self.browser, {})
+        return dict(_BROWSER_CAPABILITIES.get(self.browser, _EMPTY))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert settings to dictionary"""
@@ -297,8 +369,14 @@ class TestSettings:
     
     def save_to_file(self, filepath: str = "config/settings.json"):
         """Save settings to JSON file"""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+            return
+        
+        # Same 2-space layout as the orjson path; dumps() is one encoder call
         with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            f.write(json.dumps(self.to_dict(), indent=2))
     
     @classmethod
     def load_from_file(cls, filepath: str = "config/settings.json") -> 'TestSettings':
@@ -306,12 +384,21 @@ class TestSettings:
         with open(filepath, 'r') as f:
             data = json.load(f)
         
+        # Drop keys that are not settings fields (e.g. derived "window_size")
+        data = {key: data[key] for key in cls._FIELD_NAMES if key in data}
+        
         # Convert string values back to enums
-        data['environment'] = EnvironmentType(data['environment'])
-        data['browser'] = BrowserType(data['browser'])
+        if 'environment' in data:
+            data['environment'] = EnvironmentType(data['environment'])
+        if 'browser' in data:
+            data['browser'] = BrowserType(data['browser'])
         
         return cls(**data)
 
 
+# Cache field names so (de)serialization does not call fields() every time
+TestSettings._FIELD_NAMES = frozenset(f.name for f in fields(TestSettings))
+
+
 # Global settings instance
 settings = TestSettings()
\ No newline at end of file
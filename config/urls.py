@@ -2,17 +2,110 @@
 URL configuration for the testing framework.
 Centralized URL management for different environments and applications.
 """
-from typing import Dict, Any
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache
+from typing import Dict, Any, ClassVar, Tuple
+from enum import Enum, IntEnum
 from config.settings import settings
 
 
-class AppType(Enum):
-    """Application types"""
-    WEB_APP = "web_app"
-    MOBILE_APP = "mobile_app"
-    API = "api"
-    ADMIN = "admin"
+class AppType(IntEnum):
+    """Application types (int-valued so they can index per-app tuples)"""
+    WEB_APP = 0
+    MOBILE_APP = 1
+    API = 2
+    ADMIN = 3
+    
+    # Keep the "AppType.WEB_APP" form in messages instead of the bare int
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name used as the key in URL listings"""
+        return self.name.lower()
+
+
+# Application-specific paths
+_PATHS = {
+    AppType.WEB_APP: {
+        "login": "/login.aspx",
+        "logout": "/logout.aspx",
+        "dashboard": "/bank/main.aspx",
+        "account_summary": "/bank/account-summary.aspx",
+        "transfer_funds": "/bank/transfer.aspx",
+        "pay_bills": "/bank/billpay.aspx",
+        "contact": "/bank/contact.aspx",
+        "search": "/search.aspx"
+    },
+    AppType.ADMIN: {
+        "login": "/admin/login",
+        "dashboard": "/admin/dashboard",
+        "users": "/admin/users",
+        "settings": "/admin/settings",
+        "reports": "/admin/reports"
+    },
+    AppType.API: {
+        "auth": {
+            "login": "/api/login",
+            "logout": "/api/logout",
+            "refresh": "/api/refresh",
+            "validate": "/api/validate"
+        },
+        "users": {
+            "list": "/api/users",
+            "create": "/api/users",
+            "detail": "/api/users/{id}",
+            "update": "/api/users/{id}",
+            "delete": "/api/users/{id}",
+            "search": "/api/users/search"
+        },
+        "products": {
+            "list": "/api/products",
+            "create": "/api/products",
+            "detail": "/api/products/{id}",
+            "update": "/api/products/{id}",
+            "delete": "/api/products/{id}",
+            "categories": "/api/products/categories"
+        },
+        "orders": {
+            "list": "/api/orders",
+            "create": "/api/orders",
+            "detail": "/api/orders/{id}",
+            "update": "/api/orders/{id}",
+            "cancel": "/api/orders/{id}/cancel"
+        }
+    }
+}
+
+# API paths flattened to dotted keys, e.g. "auth.login" -> "/api/login"
+_API_PATHS = {
+    f"{category}.{endpoint}": path
+    for category, endpoints in _PATHS[AppType.API].items()
+    for endpoint, path in endpoints.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _lookup_path(app_type: AppType, endpoint: str) -> str:
+    """Resolve (and memoize) the path for application type and endpoint"""
+    if app_type not in _PATHS:
+        raise ValueError(f"Unknown application type: {app_type}")
+    
+    # Nested API endpoints are looked up by their dotted key (e.g. "auth.login")
+    if app_type == AppType.API:
+        try:
+            return _API_PATHS[endpoint]
+        except KeyError:
+            if endpoint in _PATHS[app_type]:
+                raise ValueError(f"Endpoint {endpoint} points to a category, not a specific endpoint") from None
+            raise ValueError(f"Unknown API endpoint: {endpoint}") from None
+    
+    # Regular endpoints
+    if endpoint not in _PATHS[app_type]:
+        raise ValueError(f"Unknown endpoint for {app_type}: {endpoint}")
+    
+    return _PATHS[app_type][endpoint]
 
 
 class URLConfig:
@@ -21,62 +114,39 @@ class URLConfig:
     Provides URLs for different applications and environments.
     """
     
+    # "__dict__" is kept for the cached_property convenience URLs
+    __slots__ = ("base_url", "api_url", "_base_urls", "_url_cache", "__dict__")
+    
+    # Application-specific paths (shared, never mutated)
+    _paths: ClassVar[Dict[AppType, Dict[str, Any]]] = _PATHS
+    
     def __init__(self, base_url: str = None, api_url: str = None):
         self.base_url = base_url or settings.base_url
         self.api_url = api_url or settings.api_url
         
-        # Application-specific paths
-        self._paths = {
-            AppType.WEB_APP: {
-                "login": "/login.aspx",
-                "logout": "/logout.aspx",
-                "dashboard": "/bank/main.aspx",
-                "account_summary": "/bank/account-summary.aspx",
-                "transfer_funds": "/bank/transfer.aspx",
-                "pay_bills": "/bank/billpay.aspx",
-                "contact": "/bank/contact.aspx",
-                "search": "/search.aspx"
-            },
-            AppType.ADMIN: {
-                "login": "/admin/login",
-                "dashboard": "/admin/dashboard",
-                "users": "/admin/users",
-                "settings": "/admin/settings",
-                "reports": "/admin/reports"
-            },
-            AppType.API: {
-                "auth": {
-                    "login": "/api/login",
-                    "logout": "/api/logout",
-                    "refresh": "/api/refresh",
-                    "validate": "/api/validate"
-                },
-                "users": {
-                    "list": "/api/users",
-                    "create": "/api/users",
-                    "detail": "/api/users/{id}",
-                    "update": "/api/users/{id}",
-                    "delete": "/api/users/{id}",
-                    "search": "/api/users/search"
-                },
-                "products": {
-                    "list": "/api/products",
-                    "create": "/api/products",
-                    "detail": "/api/products/{id}",
-                    "update": "/api/products/{id}",
-                    "delete": "/api/products/{id}",
-                    "categories": "/api/products/categories"
-                },
-                "orders": {
-                    "list": "/api/orders",
-                    "create": "/api/orders",
-                    "detail": "/api/orders/{id}",
-                    "update": "/api/orders/{id}",
-                    "cancel": "/api/orders/{id}/cancel"
-                }
-            }
+        # Base URL per application type, indexed by AppType value and
+        # without trailing slashes
+        base = self.base_url.rstrip('/')
+        self._base_urls: Tuple[str, ...] = (
+            base,                        # AppType.WEB_APP
+            f"{base}/mobile",            # AppType.MOBILE_APP
+            self.api_url.rstrip('/'),    # AppType.API
+            f"{base}/admin",             # AppType.ADMIN
+        )
+        
+        # Fully-formed URLs for parameterless lookups
+        self._url_cache: Dict[Tuple[AppType, str], str] = {
+            (app_type, endpoint): f"{self._get_base_url(app_type)}{path}"
+            for app_type in self._paths
+            for endpoint, path in self._iter_paths(app_type)
         }
     
+    def _iter_paths(self, app_type: AppType):
+        """Iterate (endpoint, path) pairs, using dotted keys for API endpoints"""
+        if app_type == AppType.API:
+            return iter(_API_PATHS.items())
+        return iter(self._paths[app_type].items())
+    
     def get_url(self, app_type: AppType, endpoint: str, **params) -> str:
         """
         Get complete URL for given application type and endpoint.
@@ -89,6 +159,11 @@ class URLConfig:
         Returns:
             Complete formatted URL
         """
+        if not params:
+            url = self._url_cache.get((app_type, endpoint))
+            if url is not None:
+                return url
+        
         base = self._get_base_url(app_type)
         path = self._get_path(app_type, endpoint)
         
@@ -99,45 +174,18 @@ class URLConfig:
             except KeyError as e:
                 raise ValueError(f"Missing parameter for URL formatting: {e}")
         
-        return f"{base.rstrip('/')}{path}"
+        return f"{base}{path}"
     
     def _get_base_url(self, app_type: AppType) -> str:
         """Get base URL for application type"""
-        base_urls = {
-            AppType.WEB_APP: self.base_url,
-            AppType.ADMIN: f"{self.base_url}/admin",
-            AppType.API: self.api_url,
-            AppType.MOBILE_APP: f"{self.base_url}/mobile"
-        }
-        return base_urls.get(app_type, self.base_url)
+        try:
+            return self._base_urls[AppType(app_type)]
+        except ValueError:
+            raise ValueError(f"Unknown application type: {app_type}") from None
     
     def _get_path(self, app_type: AppType, endpoint: str) -> str:
         """Get path for application type and endpoint"""
-        if app_type not in self._paths:
-            raise ValueError(f"Unknown application type: {app_type}")
-        
-        # Handle nested endpoints (e.g., API endpoints)
-        if app_type == AppType.API:
-            # Split endpoint like "auth.login"
-            parts = endpoint.split('.')
-            current = self._paths[app_type]
-            
-            for part in parts:
-                if part in current:
-                    current = current[part]
-                else:
-                    raise ValueError(f"Unknown API endpoint: {endpoint}")
-            
-            if isinstance(current, dict):
-                raise ValueError(f"Endpoint {endpoint} points to a category, not a specific endpoint")
-            
-            return current
-        
-        # Regular endpoints
-        if endpoint not in self._paths[app_type]:
-            raise ValueError(f"Unknown endpoint for {app_type}: {endpoint}")
-        
-        return self._paths[app_type][endpoint]
+        return _lookup_path(app_type, endpoint)
     
     def get_login_url(self, app_type: AppType = AppType.WEB_APP) -> str:
         """Get login URL for application type"""
@@ -151,33 +199,33 @@ class URLConfig:
         """Get API endpoint URL"""
         return self.get_url(AppType.API, f"{category}.{endpoint}", **params)
     
-    # Convenience methods for common URLs
-    @property
+    # Convenience methods for common URLs (cached; URLConfig is immutable after init)
+    @cached_property
     def login_page(self) -> str:
         """Get web app login page URL"""
         return self.get_login_url(AppType.WEB_APP)
     
-    @property
+    @cached_property
     def dashboard_page(self) -> str:
         """Get web app dashboard URL"""
         return self.get_dashboard_url(AppType.WEB_APP)
     
-    @property
+    @cached_property
     def account_summary_page(self) -> str:
         """Get account summary page URL"""
         return self.get_url(AppType.WEB_APP, "account_summary")
     
-    @property
+    @cached_property
     def transfer_funds_page(self) -> str:
         """Get transfer funds page URL"""
         return self.get_url(AppType.WEB_APP, "transfer_funds")
     
-    @property
+    @cached_property
     def api_auth_login(self) -> str:
         """Get API auth login endpoint"""
         return self.get_api_endpoint("auth", "login")
     
-    @property
+    @cached_property
     def api_users_list(self) -> str:
         """Get API users list endpoint"""
         return self.get_api_endpoint("users", "list")
@@ -188,35 +236,29 @@ class URLConfig:
         
         for app_type in AppType:
             if app_type in self._paths:
-                app_urls = {}
-                
-                if app_type == AppType.API:
-                    # Flatten nested API endpoints
-                    for category, endpoints in self._paths[app_type].items():
-                        if isinstance(endpoints, dict):
-                            for endpoint, path in endpoints.items():
-                                key = f"{category}.{endpoint}"
-                                app_urls[key] = f"{self._get_base_url(app_type)}{path}"
-                else:
-                    for endpoint, path in self._paths[app_type].items():
-                        app_urls[endpoint] = f"{self._get_base_url(app_type)}{path}"
-                
-                all_urls[app_type.value] = app_urls
+                base = self._base_urls[app_type]
+                all_urls[app_type.label] = {
+                    endpoint: base + path
+                    for endpoint, path in self._iter_paths(app_type)
+                }
         
         return all_urls
     
     def validate_urls(self) -> Dict[str, Any]:
-        """Validate all configured URLs"""
+        """Validate all configured URLs concurrently over a pooled session"""
         import requests
         from requests.exceptions import RequestException
         
         results = {}
+        pending = {}
         
-        for app_type, endpoints in self.get_all_urls().items():
-            results[app_type] = {}
-            
-            for endpoint_name, url in endpoints.items():
-                try:
+        with requests.Session() as session, ThreadPoolExecutor(
+            max_workers=max(1, settings.max_parallel_workers)
+        ) as executor:
+            for app_type, endpoints in self.get_all_urls().items():
+                results[app_type] = {}
+                
+                for endpoint_name, url in endpoints.items():
                     # Skip formatting for URLs with placeholders
                     if '{' in url and '}' in url:
                         results[app_type][endpoint_name] = {
@@ -225,8 +267,19 @@ class URLConfig:
                         }
                         continue
                     
+                    # Reserve the slot so results keep the configured order
+                    results[app_type][endpoint_name] = None
+                    future = executor.submit(
+                        session.head, url, timeout=5,
+                        verify=settings.ssl_verification, allow_redirects=False
+                    )
+                    pending[future] = (app_type, endpoint_name, url)
+            
+            for future in as_completed(pending):
+                app_type, endpoint_name, url = pending[future]
+                try:
                     # Test URL accessibility
-                    response = requests.head(url, timeout=5, verify=settings.ssl_verification)
+                    response = future.result()
                     results[app_type][endpoint_name] = {
                         "status": "accessible" if response.status_code < 400 else "error",
                         "status_code": response.status_code,
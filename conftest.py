@@ -1,21 +1,22 @@
 """
 Advanced Pytest configuration with fixtures for the entire test suite
 """
-import os
 import json
+import copy
 import pytest
 import logging
-from datetime import datetime
-from typing import Dict, Any, Generator
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from playwright.sync_api import Browser, Page, sync_playwright
+import time
+from typing import Dict, Any, Generator, TYPE_CHECKING
 from dotenv import load_dotenv
-from src.core.browser_factory import BrowserFactory
-from src.core.api_client import APIClient
 from src.core.logger import TestLogger
-from utilities.screenshot_manager import ScreenshotManager
-from utilities.bug_reporter import BugReporter
+
+# Browser drivers, the API client and the bug reporter are imported inside
+# the fixtures/hooks that use them so collection and non-browser runs
+# don't pay for selenium/playwright imports
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from playwright.sync_api import Browser, Page, Playwright
+    from src.core.api_client import APIClient
 
 # Load environment variables
 load_dotenv()
@@ -23,37 +24,46 @@ load_dotenv()
 # Configure logging
 logger = TestLogger.get_logger(__name__)
 
+# Chrome options shared by every selenium_driver instance
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080"
+)
+_CHROME_EXCLUDE_SWITCHES = ("enable-logging",)
+_CHROME_LOGGING_PREFS = {"performance": "ALL", "browser": "ALL"}
+
 @pytest.fixture(scope="session")
 def test_config() -> Dict[str, Any]:
-    """Load test configuration"""
-    config = {
-        "base_url": os.getenv("BASE_URL", "https://demo.testfire.net"),
-        "api_url": os.getenv("API_URL", "https://jsonplaceholder.typicode.com"),
-        "browser": os.getenv("BROWSER", "chrome"),
-        "headless": os.getenv("HEADLESS", "true").lower() == "true",
-        "timeout": int(os.getenv("TIMEOUT", "30")),
-        "screenshot_on_fail": True,
-        "video_on_fail": False
+    """Load test configuration as a view over the shared TestSettings"""
+    # Imported here so the settings snapshot sees the .env values loaded above
+    from config.settings import settings
+    
+    return settings.to_dict() | {
+        "timeout": settings.browser_timeout,
+        "screenshot_on_fail": settings.screenshot_on_failure,
+        "video_on_fail": settings.video_on_failure
     }
-    return config
 
 @pytest.fixture(scope="function")
-def selenium_driver(test_config) -> Generator[webdriver.Remote, None, None]:
+def selenium_driver(test_config) -> Generator["webdriver.Remote", None, None]:
     """Selenium WebDriver fixture with advanced configuration"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    
     options = Options()
     
     if test_config["headless"]:
         options.add_argument("--headless")
     
     # Advanced Chrome options
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    for argument in _CHROME_ARGS:
+        options.add_argument(argument)
+    options.add_experimental_option("excludeSwitches", list(_CHROME_EXCLUDE_SWITCHES))
     
     # Enable performance logging
-    options.set_capability("goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"})
+    options.set_capability("goog:loggingPrefs", dict(_CHROME_LOGGING_PREFS))
     
     driver = webdriver.Chrome(options=options)
     driver.implicitly_wait(test_config["timeout"])
@@ -67,18 +77,36 @@ def selenium_driver(test_config) -> Generator[webdriver.Remote, None, None]:
     driver.quit()
     logger.info("Selenium driver closed")
 
-@pytest.fixture(scope="function")
-def playwright_page(test_config) -> Generator[Page, None, None]:
-    """Playwright page fixture"""
+@pytest.fixture(scope="session")
+def _pw() -> Generator["Playwright", None, None]:
+    """Playwright driver process shared by the whole session"""
+    from playwright.sync_api import sync_playwright
+    
     playwright = sync_playwright().start()
     
-    browser_type = getattr(playwright, test_config["browser"])
+    yield playwright
+    
+    # Teardown
+    playwright.stop()
+
+@pytest.fixture(scope="session")
+def _pw_browser(_pw, test_config) -> Generator["Browser", None, None]:
+    """Playwright browser launched once per session"""
+    browser_type = getattr(_pw, test_config["browser"])
     browser = browser_type.launch(
         headless=test_config["headless"],
         args=["--no-sandbox", "--disable-dev-shm-usage"]
     )
     
-    context = browser.new_context(
+    yield browser
+    
+    # Teardown
+    browser.close()
+
+@pytest.fixture(scope="function")
+def playwright_page(_pw_browser, test_config) -> Generator["Page", None, None]:
+    """Playwright page fixture (fresh context per test)"""
+    context = _pw_browser.new_context(
         viewport={"width": 1920, "height": 1080},
         record_video_dir="reports/videos" if test_config["video_on_fail"] else None
     )
@@ -88,25 +116,35 @@ def playwright_page(test_config) -> Generator[Page, None, None]:
     
     yield page
     
-    # Teardown
-    if test_config["video_on_fail"]:
-        page.close()
-        context.close()
-    browser.close()
-    playwright.stop()
+    # Teardown; the context must be closed since the browser outlives the test
+    page.close()
+    context.close()
 
 @pytest.fixture(scope="session")
-def api_client(test_config) -> APIClient:
+def api_client(test_config) -> "APIClient":
     """API client fixture"""
+    from src.core.api_client import APIClient
+    
     client = APIClient(base_url=test_config["api_url"])
-    return client
+    yield client
+    
+    # Release pooled connections
+    client.close()
 
-@pytest.fixture(scope="function")
-def test_data() -> Dict[str, Any]:
-    """Load test data"""
+@pytest.fixture(scope="session")
+def _parsed_test_data() -> Dict[str, Any]:
+    """Parse the test data file once per session"""
     import yaml
+    
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open("test_data/test_cases.yaml", "r") as file:
-        return yaml.safe_load(file)
+        return yaml.load(file, Loader=loader)
+
+@pytest.fixture(scope="function")
+def test_data(_parsed_test_data) -> Dict[str, Any]:
+    """Load test data (a private deep copy per test)"""
+    return copy.deepcopy(_parsed_test_data)
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
@@ -114,38 +152,47 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
     
-    if report.when == "call" and report.failed:
-        # Take screenshot if driver is available
-        if "selenium_driver" in item.funcargs:
-            driver = item.funcargs["selenium_driver"]
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            screenshot_path = f"reports/screenshots/failure_{item.name}_{timestamp}.png"
+    # Nothing to collect for passing/skipped tests or setup/teardown phases
+    if report.when != "call" or not report.failed:
+        return
+    
+    from config.settings import settings
+    from utilities.bug_reporter import BugReporter
+    
+    # One timestamp shared by every artifact of this failure
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    
+    # Take screenshot if driver is available
+    if "selenium_driver" in item.funcargs:
+        driver = item.funcargs["selenium_driver"]
+        screenshot_path = f"reports/screenshots/failure_{item.name}_{timestamp}.png"
+        
+        try:
+            driver.save_screenshot(screenshot_path)
+            report.screenshot = screenshot_path
+            logger.error(f"Screenshot saved: {screenshot_path}")
             
-            try:
-                driver.save_screenshot(screenshot_path)
-                report.screenshot = screenshot_path
-                logger.error(f"Screenshot saved: {screenshot_path}")
-                
-                # Get browser logs
+            # Get browser logs (a round trip to the browser, so DEBUG only)
+            if settings.log_level.upper() == "DEBUG":
                 browser_logs = driver.get_log("browser")
                 if browser_logs:
                     log_file = f"reports/logs/browser_{item.name}_{timestamp}.json"
                     with open(log_file, "w") as f:
                         json.dump(browser_logs, f, indent=2)
-                
-            except Exception as e:
-                logger.error(f"Failed to capture screenshot: {e}")
-        
-        # Create bug report
-        bug_reporter = BugReporter()
-        bug_report = bug_reporter.create_bug_report(
-            test_name=item.name,
-            error=str(report.longrepr),
-            steps_to_reproduce=item.function.__doc__ or "No steps documented"
-        )
-        
-        if bug_report:
-            logger.info(f"Bug report created: {bug_report}")
+            
+        except Exception as e:
+            logger.error(f"Failed to capture screenshot: {e}")
+    
+    # Create bug report
+    bug_reporter = BugReporter()
+    bug_report = bug_reporter.create_bug_report(
+        test_name=item.name,
+        error=str(report.longrepr),
+        steps_to_reproduce=item.function.__doc__ or "No steps documented"
+    )
+    
+    if bug_report:
+        logger.info(f"Bug report created: {bug_report}")
 
 @pytest.fixture(autouse=True)
 def setup_teardown(request, test_config):
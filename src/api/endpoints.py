@@ -2,13 +2,37 @@
 API endpoint configurations and route definitions.
 Centralized management of all API endpoints with parameter support.
 """
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, FrozenSet, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from urllib.parse import urlencode
+import copy
 import json
+import re
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON serializer
+    orjson = None
 
-class HTTPMethod(Enum):
+try:
+    import msgpack
+except ImportError:  # optional binary export format
+    msgpack = None
+
+
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are also strings"""
+        def __str__(self) -> str:
+            return self.value
+
+
+class HTTPMethod(StrEnum):
     """HTTP methods enum"""
     GET = "GET"
     POST = "POST"
@@ -19,7 +43,7 @@ class HTTPMethod(Enum):
     OPTIONS = "OPTIONS"
 
 
-class EndpointCategory(Enum):
+class EndpointCategory(StrEnum):
     """API endpoint categories"""
     AUTH = "auth"
     USERS = "users"
@@ -30,7 +54,66 @@ class EndpointCategory(Enum):
     UTILITIES = "utilities"
 
 
-@dataclass
+# Matches "{name}" placeholders in endpoint paths
+_PLACEHOLDER_RE = re.compile(r'\{([^}]+)\}')
+
+# Sentinel for single-probe dictionary lookups
+_MISSING = object()
+
+# json.dumps separators for compact output (no spaces)
+_COMPACT = (',', ':')
+
+PathSegments = Tuple[Tuple[bool, str], ...]
+
+
+def _parse_path(path: str) -> PathSegments:
+    """Split a path template into (is_placeholder, text) segments"""
+    parts = _PLACEHOLDER_RE.split(path)
+    # re.split alternates literal text and captured placeholder names
+    return tuple(
+        (index % 2 == 1, text)
+        for index, text in enumerate(parts)
+        if text or index % 2 == 1
+    )
+
+
+def _assemble(path_segments: PathSegments, values: Dict[str, Any], query: str) -> str:
+    """Join path segments, filled from ``values``, and an encoded query string"""
+    # Fill path parameters in a single pass; unknown placeholders stay as-is
+    parts = []
+    for is_placeholder, text in path_segments:
+        if not is_placeholder:
+            parts.append(text)
+        elif text in values:
+            parts.append(str(values[text]))
+        else:
+            parts.append(f"{{{text}}}")
+    path = ''.join(parts)
+    return f"{path}?{query}" if query else path
+
+
+@lru_cache(maxsize=4096)
+def _build_url(
+    base_url: str,
+    path_segments: PathSegments,
+    path_params: FrozenSet[str],
+    frozen_params: Tuple[Tuple[str, type, Any], ...]
+) -> str:
+    """
+    Build (and memoize) a complete URL from parsed path segments and params.
+    
+    Each param is keyed as (name, type, value): values that compare equal
+    but render differently (True/1, 1.0/1) must not share a cache entry.
+    """
+    # Build query string from remaining params
+    query = [(k, v) for k, _, v in frozen_params if k not in path_params]
+    encoded = urlencode(query, doseq=True) if query else ""
+    
+    path = _assemble(path_segments, {k: v for k, _, v in frozen_params}, encoded)
+    return f"{base_url.rstrip('/')}{path}"
+
+
+@dataclass(slots=True)
 class EndpointConfig:
     """Configuration for a single API endpoint"""
     name: str
@@ -40,56 +123,249 @@ class EndpointConfig:
     description: str = ""
     requires_auth: bool = True
     parameters: List[Dict[str, Any]] = field(default_factory=list)
-    headers: Dict[str, str] = field(default_factory=dict)
-    success_codes: List[int] = field(default_factory=lambda: [200, 201, 204])
+    # None until a header is needed; treated as empty when serialized
+    headers: Optional[Dict[str, str]] = None
+    success_codes: Tuple[int, ...] = (200, 201, 204)
     timeout: int = 30
     retry_count: int = 3
     schema_validation: bool = True
+    # Parsed form of ``path``, filled in by __post_init__
+    _path_params: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _path_segments: PathSegments = field(init=False, repr=False, compare=False)
+    # Slots backing the lazily built as_dict / openapi_summary
+    _as_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _openapi_summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate endpoint configuration"""
         if not self.path.startswith('/'):
             self.path = '/' + self.path
         
+        # Status codes are never mutated; store them as a tuple
+        if not isinstance(self.success_codes, tuple):
+            self.success_codes = tuple(self.success_codes)
+        
+        # Parse the path template once instead of on every URL build
+        self._path_segments = _parse_path(self.path)
+        self._path_params = frozenset(
+            text for is_placeholder, text in self._path_segments if is_placeholder
+        )
+        
         # Set default headers based on method
         if self.method in [HTTPMethod.POST, HTTPMethod.PUT, HTTPMethod.PATCH]:
-            if 'Content-Type' not in self.headers:
+            if self.headers is None:
+                self.headers = {'Content-Type': 'application/json'}
+            elif 'Content-Type' not in self.headers:
                 self.headers['Content-Type'] = 'application/json'
     
     def get_full_path(self, base_url: str = "", **params) -> str:
         """Get complete URL with parameters"""
-        path = self.path
-        
-        # Replace path parameters
-        for key, value in params.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in path:
-                path = path.replace(placeholder, str(value))
-                # Remove from params to avoid duplicate in query string
-                params.pop(key)
-        
-        # Build query string from remaining params
-        if params:
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            path = f"{path}?{query_string}"
-        
-        return f"{base_url.rstrip('/')}{path}"
+        # Keep call order (not sorted) so the query string order is unchanged
+        frozen_params = tuple((k, type(v), v) for k, v in params.items())
+        try:
+            return _build_url(base_url, self._path_segments, self._path_params, frozen_params)
+        except TypeError:
+            # Unhashable parameter values can't be memoized
+            return _build_url.__wrapped__(
+                base_url, self._path_segments, self._path_params, frozen_params
+            )
+    
+    @property
+    def openapi_summary(self) -> str:
+        """Human-readable summary used in the OpenAPI export"""
+        if self._openapi_summary is None:
+            self._openapi_summary = self.name.replace('_', ' ').title()
+        return self._openapi_summary
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert endpoint configuration to dictionary"""
-        return {
-            "name": self.name,
-            "path": self.path,
-            "method": self.method.value,
-            "category": self.category.value,
-            "description": self.description,
-            "requires_auth": self.requires_auth,
-            "parameters": self.parameters,
-            "headers": self.headers,
-            "success_codes": self.success_codes,
-            "timeout": self.timeout,
-            "retry_count": self.retry_count
-        }
+        # Fresh top-level dict, as before caching; as_dict stays untouched
+        return dict(self.as_dict)
+    
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """Dictionary form of the endpoint, built on first access"""
+        if self._as_dict is None:
+            self._as_dict = {
+                "name": self.name,
+                "path": self.path,
+                "method": self.method,
+                "category": self.category,
+                "description": self.description,
+                "requires_auth": self.requires_auth,
+                "parameters": self.parameters,
+                "headers": self.headers if self.headers is not None else {},
+                "success_codes": self.success_codes,
+                "timeout": self.timeout,
+                "retry_count": self.retry_count
+            }
+        return self._as_dict
+
+
+# Error status codes documented for every operation in the OpenAPI export
+_ERROR_CODES: Tuple[str, ...] = tuple(str(code) for code in (400, 401, 403, 404, 500))
+
+
+# Raw keyword arguments for the built-in endpoints. EndpointConfig objects
+# are only created when an endpoint is first requested.
+_ENDPOINT_SPECS: Dict[str, Dict[str, Any]] = {
+    # Authentication endpoints
+    "login": dict(
+        name="login",
+        path="/api/v1/auth/login",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.AUTH,
+        description="Authenticate user and get access token",
+        requires_auth=False,
+        parameters=[
+            {"name": "username", "type": "string", "required": True},
+            {"name": "password", "type": "string", "required": True}
+        ],
+        success_codes=(200,)
+    ),
+
+    "logout": dict(
+        name="logout",
+        path="/api/v1/auth/logout",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.AUTH,
+        description="Logout user and invalidate token",
+        success_codes=(200, 204)
+    ),
+
+    "refresh_token": dict(
+        name="refresh_token",
+        path="/api/v1/auth/refresh",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.AUTH,
+        description="Refresh access token using refresh token",
+        success_codes=(200,)
+    ),
+
+    # User management endpoints
+    "get_users": dict(
+        name="get_users",
+        path="/api/v1/users",
+        method=HTTPMethod.GET,
+        category=EndpointCategory.USERS,
+        description="Get list of users with pagination",
+        parameters=[
+            {"name": "page", "type": "integer", "required": False, "default": 1},
+            {"name": "limit", "type": "integer", "required": False, "default": 20},
+            {"name": "role", "type": "string", "required": False},
+            {"name": "active", "type": "boolean", "required": False}
+        ],
+        success_codes=(200,)
+    ),
+
+    "create_user": dict(
+        name="create_user",
+        path="/api/v1/users",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.USERS,
+        description="Create a new user",
+        parameters=[
+            {"name": "username", "type": "string", "required": True},
+            {"name": "email", "type": "string", "required": True},
+            {"name": "password", "type": "string", "required": True},
+            {"name": "first_name", "type": "string", "required": False},
+            {"name": "last_name", "type": "string", "required": False},
+            {"name": "role", "type": "string", "required": False, "default": "user"}
+        ],
+        success_codes=(201,)
+    ),
+
+    "get_user": dict(
+        name="get_user",
+        path="/api/v1/users/{user_id}",
+        method=HTTPMethod.GET,
+        category=EndpointCategory.USERS,
+        description="Get user details by ID",
+        parameters=[
+            {"name": "user_id", "type": "string", "required": True, "in": "path"}
+        ],
+        success_codes=(200,)
+    ),
+
+    "update_user": dict(
+        name="update_user",
+        path="/api/v1/users/{user_id}",
+        method=HTTPMethod.PUT,
+        category=EndpointCategory.USERS,
+        description="Update user details",
+        parameters=[
+            {"name": "user_id", "type": "string", "required": True, "in": "path"}
+        ],
+        success_codes=(200,)
+    ),
+
+    "delete_user": dict(
+        name="delete_user",
+        path="/api/v1/users/{user_id}",
+        method=HTTPMethod.DELETE,
+        category=EndpointCategory.USERS,
+        description="Delete a user",
+        parameters=[
+            {"name": "user_id", "type": "string", "required": True, "in": "path"}
+        ],
+        success_codes=(204,)
+    ),
+
+    # Product endpoints
+    "get_products": dict(
+        name="get_products",
+        path="/api/v1/products",
+        method=HTTPMethod.GET,
+        category=EndpointCategory.PRODUCTS,
+        description="Get list of products",
+        parameters=[
+            {"name": "category", "type": "string", "required": False},
+            {"name": "in_stock", "type": "boolean", "required": False},
+            {"name": "min_price", "type": "number", "required": False},
+            {"name": "max_price", "type": "number", "required": False}
+        ],
+        success_codes=(200,)
+    ),
+
+    "create_product": dict(
+        name="create_product",
+        path="/api/v1/products",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.PRODUCTS,
+        description="Create a new product",
+        success_codes=(201,)
+    ),
+
+    # Order endpoints
+    "create_order": dict(
+        name="create_order",
+        path="/api/v1/orders",
+        method=HTTPMethod.POST,
+        category=EndpointCategory.ORDERS,
+        description="Create a new order",
+        success_codes=(201,)
+    ),
+
+    # System endpoints
+    "health_check": dict(
+        name="health_check",
+        path="/api/v1/health",
+        method=HTTPMethod.GET,
+        category=EndpointCategory.SYSTEM,
+        description="Check system health status",
+        requires_auth=False,
+        success_codes=(200,)
+    ),
+
+    "metrics": dict(
+        name="metrics",
+        path="/api/v1/metrics",
+        method=HTTPMethod.GET,
+        category=EndpointCategory.SYSTEM,
+        description="Get system metrics",
+        success_codes=(200,)
+    )
+}
 
 
 class APIEndpoints:
@@ -101,180 +377,56 @@ class APIEndpoints:
     def __init__(self, base_url: str = ""):
         self.base_url = base_url
         self._endpoints: Dict[str, EndpointConfig] = {}
-        self._initialize_endpoints()
+        self._by_category: Dict[EndpointCategory, Tuple[EndpointConfig, ...]] = {}
+        self._endpoints_view: Optional[MappingProxyType] = None
+        self._fully_loaded = False
+        # Bumped on every change that affects the OpenAPI export
+        self._version = 0
+        self._openapi_version = -1
+        self._openapi_spec: Optional[Dict[str, Any]] = None
+        self._openapi_bytes: Dict[str, bytes] = {}
     
-    def _initialize_endpoints(self):
-        """Initialize all API endpoints"""
-        
-        # Authentication endpoints
-        self._endpoints["login"] = EndpointConfig(
-            name="login",
-            path="/api/v1/auth/login",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.AUTH,
-            description="Authenticate user and get access token",
-            requires_auth=False,
-            parameters=[
-                {"name": "username", "type": "string", "required": True},
-                {"name": "password", "type": "string", "required": True}
-            ],
-            success_codes=[200]
-        )
+    def _materialize_all(self):
+        """Create every built-in endpoint, keeping definition order"""
+        if self._fully_loaded:
+            return
         
-        self._endpoints["logout"] = EndpointConfig(
-            name="logout",
-            path="/api/v1/auth/logout",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.AUTH,
-            description="Logout user and invalidate token",
-            success_codes=[200, 204]
-        )
-        
-        self._endpoints["refresh_token"] = EndpointConfig(
-            name="refresh_token",
-            path="/api/v1/auth/refresh",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.AUTH,
-            description="Refresh access token using refresh token",
-            success_codes=[200]
-        )
-        
-        # User management endpoints
-        self._endpoints["get_users"] = EndpointConfig(
-            name="get_users",
-            path="/api/v1/users",
-            method=HTTPMethod.GET,
-            category=EndpointCategory.USERS,
-            description="Get list of users with pagination",
-            parameters=[
-                {"name": "page", "type": "integer", "required": False, "default": 1},
-                {"name": "limit", "type": "integer", "required": False, "default": 20},
-                {"name": "role", "type": "string", "required": False},
-                {"name": "active", "type": "boolean", "required": False}
-            ],
-            success_codes=[200]
-        )
-        
-        self._endpoints["create_user"] = EndpointConfig(
-            name="create_user",
-            path="/api/v1/users",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.USERS,
-            description="Create a new user",
-            parameters=[
-                {"name": "username", "type": "string", "required": True},
-                {"name": "email", "type": "string", "required": True},
-                {"name": "password", "type": "string", "required": True},
-                {"name": "first_name", "type": "string", "required": False},
-                {"name": "last_name", "type": "string", "required": False},
-                {"name": "role", "type": "string", "required": False, "default": "user"}
-            ],
-            success_codes=[201]
-        )
-        
-        self._endpoints["get_user"] = EndpointConfig(
-            name="get_user",
-            path="/api/v1/users/{user_id}",
-            method=HTTPMethod.GET,
-            category=EndpointCategory.USERS,
-            description="Get user details by ID",
-            parameters=[
-                {"name": "user_id", "type": "string", "required": True, "in": "path"}
-            ],
-            success_codes=[200]
-        )
-        
-        self._endpoints["update_user"] = EndpointConfig(
-            name="update_user",
-            path="/api/v1/users/{user_id}",
-            method=HTTPMethod.PUT,
-            category=EndpointCategory.USERS,
-            description="Update user details",
-            parameters=[
-                {"name": "user_id", "type": "string", "required": True, "in": "path"}
-            ],
-            success_codes=[200]
-        )
-        
-        self._endpoints["delete_user"] = EndpointConfig(
-            name="delete_user",
-            path="/api/v1/users/{user_id}",
-            method=HTTPMethod.DELETE,
-            category=EndpointCategory.USERS,
-            description="Delete a user",
-            parameters=[
-                {"name": "user_id", "type": "string", "required": True, "in": "path"}
-            ],
-            success_codes=[204]
-        )
-        
-        # Product endpoints
-        self._endpoints["get_products"] = EndpointConfig(
-            name="get_products",
-            path="/api/v1/products",
-            method=HTTPMethod.GET,
-            category=EndpointCategory.PRODUCTS,
-            description="Get list of products",
-            parameters=[
-                {"name": "category", "type": "string", "required": False},
-                {"name": "in_stock", "type": "boolean", "required": False},
-                {"name": "min_price", "type": "number", "required": False},
-                {"name": "max_price", "type": "number", "required": False}
-            ],
-            success_codes=[200]
-        )
-        
-        self._endpoints["create_product"] = EndpointConfig(
-            name="create_product",
-            path="/api/v1/products",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.PRODUCTS,
-            description="Create a new product",
-            success_codes=[201]
-        )
-        
-        # Order endpoints
-        self._endpoints["create_order"] = EndpointConfig(
-            name="create_order",
-            path="/api/v1/orders",
-            method=HTTPMethod.POST,
-            category=EndpointCategory.ORDERS,
-            description="Create a new order",
-            success_codes=[201]
-        )
+        endpoints = {}
+        for name, spec in _ENDPOINT_SPECS.items():
+            endpoint = self._endpoints.pop(name, None)
+            endpoints[name] = endpoint if endpoint is not None else EndpointConfig(**spec)
+        # Custom endpoints follow the built-in ones in insertion order
+        endpoints.update(self._endpoints)
         
-        # System endpoints
-        self._endpoints["health_check"] = EndpointConfig(
-            name="health_check",
-            path="/api/v1/health",
-            method=HTTPMethod.GET,
-            category=EndpointCategory.SYSTEM,
-            description="Check system health status",
-            requires_auth=False,
-            success_codes=[200]
-        )
-        
-        self._endpoints["metrics"] = EndpointConfig(
-            name="metrics",
-            path="/api/v1/metrics",
-            method=HTTPMethod.GET,
-            category=EndpointCategory.SYSTEM,
-            description="Get system metrics",
-            success_codes=[200]
-        )
+        self._endpoints = endpoints
+        self._endpoints_view = MappingProxyType(endpoints)
+        by_category: Dict[EndpointCategory, List[EndpointConfig]] = {}
+        for endpoint in endpoints.values():
+            by_category.setdefault(endpoint.category, []).append(endpoint)
+        self._by_category = {category: tuple(items) for category, items in by_category.items()}
+        self._fully_loaded = True
+    
+    @property
+    def endpoints(self) -> MappingProxyType:
+        """Read-only view of all endpoints keyed by name"""
+        self._materialize_all()
+        return self._endpoints_view
     
     def get_endpoint(self, endpoint_name: str) -> EndpointConfig:
         """Get endpoint configuration by name"""
-        if endpoint_name not in self._endpoints:
-            raise ValueError(f"Endpoint '{endpoint_name}' not found")
-        return self._endpoints[endpoint_name]
+        endpoint = self._endpoints.get(endpoint_name, _MISSING)
+        if endpoint is _MISSING:
+            spec = _ENDPOINT_SPECS.get(endpoint_name, _MISSING)
+            if spec is _MISSING:
+                raise ValueError(f"Endpoint '{endpoint_name}' not found")
+            # Built-in endpoints are materialized on first access
+            endpoint = self._endpoints[endpoint_name] = EndpointConfig(**spec)
+        return endpoint
     
-    def get_endpoints_by_category(self, category: EndpointCategory) -> List[EndpointConfig]:
+    def get_endpoints_by_category(self, category: EndpointCategory) -> Tuple[EndpointConfig, ...]:
         """Get all endpoints for a specific category"""
-        return [
-            endpoint for endpoint in self._endpoints.values()
-            if endpoint.category == category
-        ]
+        self._materialize_all()
+        return self._by_category.get(category, ())
     
     def get_url(self, endpoint_name: str, **params) -> str:
         """Get complete URL for an endpoint"""
@@ -290,17 +442,24 @@ class APIEndpoints:
     
     def add_endpoint(self, endpoint: EndpointConfig):
         """Add a custom endpoint to the configuration"""
-        if endpoint.name in self._endpoints:
+        if endpoint.name in self._endpoints or endpoint.name in _ENDPOINT_SPECS:
             raise ValueError(f"Endpoint '{endpoint.name}' already exists")
         self._endpoints[endpoint.name] = endpoint
+        # Before full materialization the index is built from _endpoints
+        if self._fully_loaded:
+            self._by_category[endpoint.category] = self._by_category.get(endpoint.category, ()) + (endpoint,)
+        self._version += 1
+        _build_url.cache_clear()
     
     def update_base_url(self, base_url: str):
         """Update the base URL for all endpoints"""
         self.base_url = base_url
+        self._version += 1
+        _build_url.cache_clear()
     
-    def export_to_openapi(self, filepath: str = "api_spec.json"):
-        """Export endpoints to OpenAPI specification format"""
-        openapi_spec = {
+    def _openapi_document(self) -> Dict[str, Any]:
+        """OpenAPI document skeleton with an empty "paths" section"""
+        return {
             "openapi": "3.0.0",
             "info": {
                 "title": "Test API Specification",
@@ -321,51 +480,125 @@ class APIEndpoints:
                 }
             }
         }
+    
+    @staticmethod
+    def _openapi_operation(endpoint: EndpointConfig) -> Dict[str, Any]:
+        """Build the OpenAPI operation object for a single endpoint"""
+        operation = {
+            "summary": endpoint.openapi_summary,
+            "description": endpoint.description,
+            "operationId": endpoint.name,
+            "responses": {
+                str(code): {"description": "Success" if code < 400 else "Error"}
+                for code in endpoint.success_codes
+            } | {code: {"description": "Error"} for code in _ERROR_CODES}
+        }
+        
+        # Add security requirement (a new list per operation, so editing one
+        # operation's requirements can't affect the others)
+        if endpoint.requires_auth:
+            operation["security"] = [{"bearerAuth": []}]
+        
+        # Add parameters
+        if endpoint.parameters:
+            operation["parameters"] = []
+            for param in endpoint.parameters:
+                param_spec = {
+                    "name": param["name"],
+                    "in": param.get("in", "query"),
+                    "required": param.get("required", False),
+                    "schema": {"type": param["type"]}
+                }
+                if "default" in param:
+                    param_spec["schema"]["default"] = param["default"]
+                operation["parameters"].append(param_spec)
+        
+        return operation
+    
+    def _iter_openapi_paths(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield (path, path item) pairs, building one path item at a time"""
+        self._materialize_all()
         
         # Group endpoints by path
+        by_path: Dict[str, List[EndpointConfig]] = {}
         for endpoint in self._endpoints.values():
-            path = endpoint.path
-            method = endpoint.method.value.lower()
-            
-            if path not in openapi_spec["paths"]:
-                openapi_spec["paths"][path] = {}
-            
-            # Create path operation
-            operation = {
-                "summary": endpoint.name.replace('_', ' ').title(),
-                "description": endpoint.description,
-                "operationId": endpoint.name,
-                "responses": {
-                    str(code): {"description": "Success" if code < 400 else "Error"}
-                    for code in endpoint.success_codes + [400, 401, 403, 404, 500]
-                }
+            by_path.setdefault(endpoint.path, []).append(endpoint)
+        
+        for path, endpoints in by_path.items():
+            yield path, {
+                endpoint.method.lower(): self._openapi_operation(endpoint)
+                for endpoint in endpoints
             }
-            
-            # Add security requirement
-            if endpoint.requires_auth:
-                operation["security"] = [{"bearerAuth": []}]
-            
-            # Add parameters
-            if endpoint.parameters:
-                operation["parameters"] = []
-                for param in endpoint.parameters:
-                    param_spec = {
-                        "name": param["name"],
-                        "in": param.get("in", "query"),
-                        "required": param.get("required", False),
-                        "schema": {"type": param["type"]}
-                    }
-                    if "default" in param:
-                        param_spec["schema"]["default"] = param["default"]
-                    operation["parameters"].append(param_spec)
-            
-            openapi_spec["paths"][path][method] = operation
+    
+    def _cached_openapi_spec(self) -> Dict[str, Any]:
+        """OpenAPI spec shared between exports until the endpoints change"""
+        if self._openapi_version != self._version:
+            openapi_spec = self._openapi_document()
+            openapi_spec["paths"] = dict(self._iter_openapi_paths())
+            self._openapi_spec = openapi_spec
+            self._openapi_bytes = {}
+            self._openapi_version = self._version
+        return self._openapi_spec
+    
+    def _serialize_openapi(self, fmt: str) -> bytes:
+        """Serialized OpenAPI spec, memoized per format"""
+        openapi_spec = self._cached_openapi_spec()
+        data = self._openapi_bytes.get(fmt)
+        if data is None:
+            if fmt == "msgpack":
+                data = msgpack.packb(openapi_spec, use_bin_type=True)
+            elif fmt == "orjson":
+                data = orjson.dumps(openapi_spec, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(openapi_spec, indent=2).encode()
+            self._openapi_bytes[fmt] = data
+        return data
+    
+    def export_to_openapi(self, filepath: str = "api_spec.json") -> Dict[str, Any]:
+        """Export endpoints to OpenAPI specification format"""
+        if filepath.endswith('.msgpack'):
+            if msgpack is None:
+                raise ImportError("msgpack is required to export a .msgpack specification")
+            fmt = "msgpack"
+        elif orjson is not None:
+            fmt = "orjson"
+        else:
+            fmt = "json"
         
         # Write to file
-        with open(filepath, 'w') as f:
-            json.dump(openapi_spec, f, indent=2)
+        data = self._serialize_openapi(fmt)
+        with open(filepath, 'wb') as f:
+            f.write(data)
         
-        return openapi_spec
+        # Callers get their own copy; the cached spec is reused by later exports
+        return copy.deepcopy(self._cached_openapi_spec())
+    
+    def stream_openapi(self, filepath: str = "api_spec.json"):
+        """
+        Write the OpenAPI specification incrementally.
+        
+        Unlike export_to_openapi(), the full document is never held in
+        memory: each path item is serialized and written as it is built.
+        The output is compact JSON and nothing is returned.
+        """
+        with open(filepath, 'w') as f:
+            f.write('{')
+            for index, (key, value) in enumerate(self._openapi_document().items()):
+                if index:
+                    f.write(',')
+                f.write(f"{json.dumps(key)}:")
+                
+                if key != "paths":
+                    f.write(json.dumps(value, separators=_COMPACT))
+                    continue
+                
+                f.write('{')
+                for path_index, (path, path_item) in enumerate(self._iter_openapi_paths()):
+                    if path_index:
+                        f.write(',')
+                    f.write(f"{json.dumps(path)}:{json.dumps(path_item, separators=_COMPACT)}")
+                f.write('}')
+            f.write('}')
     
     def validate_request(self, endpoint_name: str, response_status: int, response_data: Dict = None) -> bool:
         """Validate API response against endpoint configuration"""
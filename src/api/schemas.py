@@ -2,8 +2,41 @@
 JSON schema definitions for API response validation.
 Ensures consistent data structures across API responses.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Mapping
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import json
+import re
+import sys
+
+from jsonschema import Draft7Validator, FormatChecker
+from jsonschema.exceptions import ValidationError
+from jsonschema.validators import extend
+from src.core.logger import TestLogger
+
+try:
+    import fastjsonschema
+except ImportError:  # optional code-generating validator backend
+    fastjsonschema = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # optional Rust-backed validator backend
+    jsonschema_rs = None
+
+try:
+    import ciso8601
+except ImportError:  # optional C ISO 8601 parser for "date-time"
+    ciso8601 = None
+
+try:
+    import email_validator
+except ImportError:  # optional validator for "email"
+    email_validator = None
+
+logger = TestLogger.get_logger(__name__)
 
 # Common schema components
 COMMON_SCHEMAS = {
@@ -33,6 +66,21 @@ COMMON_SCHEMAS = {
     }
 }
 
+# Shared definitions, merged into every registered schema and referenced via $ref
+SCHEMA_DEFS = {"$defs": COMMON_SCHEMAS}
+
+
+def _with_defs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the shared $defs to a top-level schema (in place)"""
+    schema["$defs"] = SCHEMA_DEFS["$defs"]
+    return schema
+
+
+def _resolve_ref(ref: str) -> Dict[str, Any]:
+    """Resolve a "#/$defs/<name>" reference to its shared definition"""
+    return SCHEMA_DEFS["$defs"][ref.rsplit("/", 1)[-1]]
+
+
 # Authentication schemas
 AuthResponseSchema = {
     "type": "object",
@@ -51,7 +99,7 @@ AuthResponseSchema = {
             },
             "required": ["id", "username", "email"]
         },
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["access_token", "token_type", "expires_in", "user"]
 }
@@ -78,9 +126,9 @@ UserSchema = {
         "last_name": {"type": "string", "minLength": 1, "maxLength": 50},
         "role": {"type": "string", "enum": ["admin", "user", "viewer", "qa", "devops", "finance"]},
         "is_active": {"type": "boolean"},
-        "created_at": COMMON_SCHEMAS["timestamp"],
-        "updated_at": COMMON_SCHEMAS["timestamp"],
-        "last_login": COMMON_SCHEMAS["timestamp"],
+        "created_at": {"$ref": "#/$defs/timestamp"},
+        "updated_at": {"$ref": "#/$defs/timestamp"},
+        "last_login": {"$ref": "#/$defs/timestamp"},
         "department": {"type": "string"},
         "employee_id": {"type": "string"},
         "permissions": {
@@ -98,8 +146,8 @@ UserListSchema = {
             "type": "array",
             "items": UserSchema
         },
-        "pagination": COMMON_SCHEMAS["pagination"],
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "pagination": {"$ref": "#/$defs/pagination"},
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["data", "pagination"]
 }
@@ -147,8 +195,8 @@ ProductSchema = {
             }
         },
         "manufacturer": {"type": "string"},
-        "created_at": COMMON_SCHEMAS["timestamp"],
-        "updated_at": COMMON_SCHEMAS["timestamp"]
+        "created_at": {"$ref": "#/$defs/timestamp"},
+        "updated_at": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["id", "name", "sku", "price", "stock_quantity", "in_stock"]
 }
@@ -160,8 +208,8 @@ ProductListSchema = {
             "type": "array",
             "items": ProductSchema
         },
-        "pagination": COMMON_SCHEMAS["pagination"],
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "pagination": {"$ref": "#/$defs/pagination"},
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["data", "pagination"]
 }
@@ -200,9 +248,9 @@ OrderSchema = {
         "billing_address": {"type": "string"},
         "payment_method": {"type": "string"},
         "payment_status": {"type": "string", "enum": ["pending", "paid", "failed", "refunded"]},
-        "created_at": COMMON_SCHEMAS["timestamp"],
-        "updated_at": COMMON_SCHEMAS["timestamp"],
-        "estimated_delivery": COMMON_SCHEMAS["timestamp"]
+        "created_at": {"$ref": "#/$defs/timestamp"},
+        "updated_at": {"$ref": "#/$defs/timestamp"},
+        "estimated_delivery": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["id", "order_number", "user_id", "status", "items", "total_amount", "created_at"]
 }
@@ -214,8 +262,8 @@ OrderListSchema = {
             "type": "array",
             "items": OrderSchema
         },
-        "pagination": COMMON_SCHEMAS["pagination"],
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "pagination": {"$ref": "#/$defs/pagination"},
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["data", "pagination"]
 }
@@ -224,8 +272,8 @@ OrderListSchema = {
 ErrorSchema = {
     "type": "object",
     "properties": {
-        "error": COMMON_SCHEMAS["error"],
-        "timestamp": COMMON_SCHEMAS["timestamp"],
+        "error": {"$ref": "#/$defs/error"},
+        "timestamp": {"$ref": "#/$defs/timestamp"},
         "path": {"type": "string"},
         "method": {"type": "string", "enum": ["GET", "POST", "PUT", "DELETE", "PATCH"]}
     },
@@ -247,7 +295,7 @@ ValidationErrorSchema = {
                 "required": ["field", "message"]
             }
         },
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["errors", "timestamp"]
 }
@@ -266,7 +314,7 @@ HealthCheckSchema = {
                 "messaging": {"type": "string", "enum": ["UP", "DOWN"]}
             }
         },
-        "timestamp": COMMON_SCHEMAS["timestamp"],
+        "timestamp": {"$ref": "#/$defs/timestamp"},
         "uptime": {"type": "number", "minimum": 0},
         "version": {"type": "string"}
     },
@@ -294,26 +342,253 @@ MetricsSchema = {
                 "average_response_time": {"type": "number", "minimum": 0}
             }
         },
-        "timestamp": COMMON_SCHEMAS["timestamp"]
+        "timestamp": {"$ref": "#/$defs/timestamp"}
     },
     "required": ["system", "application", "timestamp"]
 }
 
 # Schema registry
 SCHEMA_REGISTRY = {
-    "auth_response": AuthResponseSchema,
-    "refresh_token": RefreshTokenSchema,
-    "user": UserSchema,
-    "user_list": UserListSchema,
-    "create_user": CreateUserSchema,
-    "product": ProductSchema,
-    "product_list": ProductListSchema,
-    "order": OrderSchema,
-    "order_list": OrderListSchema,
-    "error": ErrorSchema,
-    "validation_error": ValidationErrorSchema,
-    "health_check": HealthCheckSchema,
-    "metrics": MetricsSchema
+    "auth_response": _with_defs(AuthResponseSchema),
+    "refresh_token": _with_defs(RefreshTokenSchema),
+    "user": _with_defs(UserSchema),
+    "user_list": _with_defs(UserListSchema),
+    "create_user": _with_defs(CreateUserSchema),
+    "product": _with_defs(ProductSchema),
+    "product_list": _with_defs(ProductListSchema),
+    "order": _with_defs(OrderSchema),
+    "order_list": _with_defs(OrderListSchema),
+    "error": _with_defs(ErrorSchema),
+    "validation_error": _with_defs(ValidationErrorSchema),
+    "health_check": _with_defs(HealthCheckSchema),
+    "metrics": _with_defs(MetricsSchema)
+}
+
+# Registered schemas serialized once, for validators that take JSON text
+SCHEMA_JSON: Dict[str, str] = {
+    name: json.dumps(schema) for name, schema in SCHEMA_REGISTRY.items()
+}
+
+
+def _freeze(obj: Any, seen: Dict[int, Any]) -> Any:
+    """
+    Read-only copy of a schema: dicts become MappingProxyType views and
+    strings are interned. Objects shared in the source stay shared.
+    """
+    frozen = seen.get(id(obj))
+    if frozen is not None:
+        return frozen
+    
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        frozen = MappingProxyType({
+            sys.intern(key): _freeze(value, seen) for key, value in obj.items()
+        })
+    elif isinstance(obj, list):
+        # Lists stay lists: jsonschema only treats lists as JSON arrays
+        frozen = [_freeze(item, seen) for item in obj]
+    else:
+        return obj
+    
+    seen[id(obj)] = frozen
+    return frozen
+
+
+def _thaw(obj: Any) -> Any:
+    """Plain-dict copy of a (possibly frozen) schema, for backends that need dicts"""
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_thaw(item) for item in obj]
+    return obj
+
+
+def _iter_keyword(schema: Any, keyword: str):
+    """Yield every string value of ``keyword`` found in a schema tree"""
+    if isinstance(schema, dict):
+        for key, value in schema.items():
+            if key == keyword and isinstance(value, str):
+                yield value
+            else:
+                yield from _iter_keyword(value, keyword)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from _iter_keyword(item, keyword)
+
+
+# Compiled "pattern" regexes of all registered schemas
+_PATTERN_CACHE: Dict[str, re.Pattern] = {
+    pattern: re.compile(pattern) for pattern in _iter_keyword(SCHEMA_REGISTRY, "pattern")
+}
+
+
+def _cached_pattern(validator, pattern: str, instance: Any, schema: Dict[str, Any]):
+    """"pattern" keyword that reuses compiled regexes from _PATTERN_CACHE"""
+    if not validator.is_type(instance, "string"):
+        return
+    regex = _PATTERN_CACHE.get(pattern)
+    if regex is None:
+        regex = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    if not regex.search(instance):
+        yield ValidationError(f"{instance!r} does not match {pattern!r}")
+
+
+# Draft 7 validator whose "pattern" checks use the precompiled regexes
+CachedPatternValidator = extend(Draft7Validator, {"pattern": _cached_pattern})
+
+
+def _is_date_time(value: Any) -> bool:
+    """ISO 8601 date-time check, using ciso8601 when installed"""
+    if not isinstance(value, str):
+        return True
+    try:
+        if ciso8601 is not None:
+            ciso8601.parse_datetime(value)
+        else:
+            datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_email(value: Any) -> bool:
+    """Syntax-only email check, using email_validator when installed"""
+    if not isinstance(value, str):
+        return True
+    if email_validator is None:
+        # Same rule as jsonschema's built-in "email" checker
+        return "@" in value
+    try:
+        email_validator.validate_email(value, check_deliverability=False)
+    except email_validator.EmailNotValidError:
+        return False
+    return True
+
+
+# Format checks for the formats the registered schemas actually use
+_FORMAT_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    name: check
+    for name, check in {"date-time": _is_date_time, "email": _is_email}.items()
+    if name in set(_iter_keyword(SCHEMA_REGISTRY, "format"))
+}
+
+# Checker used when a caller opts in with validate_formats=True; by default
+# "format" is only an annotation, as in jsonschema
+FORMAT_CHECKER = FormatChecker(formats=())
+for _format_name, _format_check in _FORMAT_CHECKS.items():
+    FORMAT_CHECKER.checks(_format_name)(_format_check)
+
+# fastjsonschema asserts the formats it knows; these overrides turn that off
+_UNCHECKED_FORMATS: Dict[str, Callable[[Any], bool]] = {
+    name: (lambda value: True) for name in _FORMAT_CHECKS
+}
+
+
+@lru_cache(maxsize=None)
+def get_compiled_validator(schema_name: str, validate_formats: bool = False) -> Draft7Validator:
+    """Build the validator for a registered schema once and reuse it"""
+    return CachedPatternValidator(
+        SchemaValidator.get_schema(schema_name),
+        format_checker=FORMAT_CHECKER if validate_formats else None
+    )
+
+
+@lru_cache(maxsize=None)
+def get_rs_validator(schema_name: str, validate_formats: bool = False):
+    """
+    jsonschema_rs validator for a registered schema.
+    
+    Returns None when jsonschema_rs is not installed or rejects the
+    schema (logged at DEBUG). Formats are only asserted with
+    validate_formats, using the same checks as the other backends.
+    """
+    if jsonschema_rs is None:
+        return None
+    schema_json = SCHEMA_JSON.get(schema_name)
+    if schema_json is None:
+        schema_json = json.dumps(SchemaValidator.get_schema_dict(schema_name))
+    options = {"formats": _FORMAT_CHECKS} if validate_formats else {}
+    try:
+        return jsonschema_rs.Draft7Validator(
+            schema_json, validate_formats=validate_formats, **options
+        )
+    except ValueError as e:
+        # DEBUG, not WARNING: validators are prebuilt at import, so a known,
+        # permanent fallback would otherwise be reported on every run
+        logger.debug(f"jsonschema_rs rejected schema '{schema_name}', using a slower backend: {e}")
+        return None
+
+
+def _schema_value(schema: Dict[str, Any], schema_path: List[Any]) -> Any:
+    """Value of the schema keyword at an absolute schema path"""
+    node = schema
+    for key in schema_path:
+        node = node[key]
+    return node
+
+
+@lru_cache(maxsize=None)
+def get_fast_validator(schema_name: str, validate_formats: bool = False) -> Optional[Callable[[Any], Any]]:
+    """
+    Code-generated fastjsonschema validator for a registered schema.
+    
+    Returns None when fastjsonschema is not installed or cannot compile
+    the schema; callers then fall back to the jsonschema validator.
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile(
+            SchemaValidator.get_schema_dict(schema_name),
+            formats=_FORMAT_CHECKS if validate_formats else _UNCHECKED_FORMATS
+        )
+    except (fastjsonschema.JsonSchemaDefinitionException, re.error) as e:
+        logger.debug(f"fastjsonschema cannot compile schema '{schema_name}', using jsonschema: {e}")
+        return None
+
+
+# Sentinels for the example generator's memo lookups and deferred array fills
+_MISSING = object()
+_FILL_ARRAY = object()
+
+# Example values for the known string patterns
+_PATTERN_EXAMPLES: Dict[str, str] = {
+    "^[A-Z0-9-]+$": "SKU-12345",
+    "^ORD-[0-9]{8}-[0-9]{6}$": "ORD-20240115-123456"
+}
+
+
+def _example_string(schema: Dict[str, Any], now: str) -> str:
+    """Example value for a string schema"""
+    if "format" in schema:
+        if schema["format"] == "date-time":
+            return now
+        elif schema["format"] == "email":
+            return "example@test.com"
+    
+    if "enum" in schema:
+        return schema["enum"][0]
+    
+    if "pattern" in schema and schema["pattern"] in _PATTERN_EXAMPLES:
+        return _PATTERN_EXAMPLES[schema["pattern"]]
+    
+    return "example_string"
+
+
+def _example_number(schema: Dict[str, Any], now: str) -> float:
+    """Example value for a number schema"""
+    if "minimum" in schema:
+        return float(schema["minimum"] + 0.1)
+    return 10.5
+
+
+# Example generators for non-container types, keyed by schema "type"
+_EXAMPLE_HANDLERS: Dict[str, Callable[[Dict[str, Any], str], Any]] = {
+    "string": _example_string,
+    "integer": lambda schema, now: schema.get("minimum", 1),
+    "number": _example_number,
+    "boolean": lambda schema, now: True
 }
 
 
@@ -321,72 +596,162 @@ class SchemaValidator:
     """Utility class for schema validation"""
     
     @staticmethod
-    def get_schema(schema_name: str) -> Dict[str, Any]:
-        """Get schema by name"""
+    def get_schema(schema_name: str) -> Mapping[str, Any]:
+        """
+        Get schema by name.
+        
+        Returns the frozen registry entry: a read-only mapping (nested
+        objects are mappingproxies too) that json.dumps and copy.deepcopy
+        don't accept. Use get_schema_dict() for an editable plain dict.
+        """
         if schema_name not in SCHEMA_REGISTRY:
             raise ValueError(f"Schema '{schema_name}' not found in registry")
         return SCHEMA_REGISTRY[schema_name]
     
     @staticmethod
-    def validate(schema_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def get_schema_dict(schema_name: str) -> Dict[str, Any]:
+        """Get a schema by name as a new plain dict (safe to serialize or modify)"""
+        return _thaw(SchemaValidator.get_schema(schema_name))
+    
+    @staticmethod
+    def validate(schema_name: str, data: Dict[str, Any],
+                 validate_formats: bool = False) -> Dict[str, Any]:
         """
         Validate data against schema.
         
         Args:
             schema_name: Name of the schema to validate against
             data: Data to validate
+            validate_formats: Also assert "format" (date-time, email)
             
         Returns:
             Dictionary with validation results
         """
-        from jsonschema import validate as jsonschema_validate
-        from jsonschema.exceptions import ValidationError
-        
-        schema = SchemaValidator.get_schema(schema_name)
+        rs_validator = get_rs_validator(schema_name, validate_formats)
+        if rs_validator is not None:
+            e = next(rs_validator.iter_errors(data), None)
+            if e is None:
+                return {
+                    "valid": True,
+                    "errors": [],
+                    "schema": schema_name
+                }
+            return {
+                "valid": False,
+                "errors": [{
+                    "path": list(e.instance_path),
+                    "message": e.message,
+                    "validator": e.schema_path[-1] if e.schema_path else None,
+                    "validator_value": _schema_value(
+                        SchemaValidator.get_schema(schema_name), e.schema_path
+                    )
+                }],
+                "schema": schema_name
+            }
         
-        try:
-            jsonschema_validate(instance=data, schema=schema)
+        fast_validator = get_fast_validator(schema_name, validate_formats)
+        if fast_validator is not None:
+            try:
+                fast_validator(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return {
+                    "valid": False,
+                    "errors": [{
+                        # Drop the leading "data" element of the generated path
+                        "path": e.path[1:],
+                        "message": e.message,
+                        "validator": e.rule,
+                        "validator_value": e.rule_definition
+                    }],
+                    "schema": schema_name
+                }
             return {
                 "valid": True,
                 "errors": [],
                 "schema": schema_name
             }
-        except ValidationError as e:
+        
+        validator = get_compiled_validator(schema_name, validate_formats)
+        e = next(validator.iter_errors(data), None)
+        
+        if e is None:
             return {
-                "valid": False,
-                "errors": [{
-                    "path": list(e.path) if e.path else [],
-                    "message": e.message,
-                    "validator": e.validator,
-                    "validator_value": e.validator_value
-                }],
+                "valid": True,
+                "errors": [],
                 "schema": schema_name
             }
+        return {
+            "valid": False,
+            "errors": [{
+                "path": list(e.path) if e.path else [],
+                "message": e.message,
+                "validator": e.validator,
+                "validator_value": e.validator_value
+            }],
+            "schema": schema_name
+        }
+    
+    @staticmethod
+    def is_valid(schema_name: str, data: Any, validate_formats: bool = False) -> bool:
+        """Pass/fail check that skips building error details"""
+        rs_validator = get_rs_validator(schema_name, validate_formats)
+        if rs_validator is not None:
+            return rs_validator.is_valid(data)
+        
+        fast_validator = get_fast_validator(schema_name, validate_formats)
+        if fast_validator is not None:
+            try:
+                fast_validator(data)
+            except fastjsonschema.JsonSchemaValueException:
+                return False
+            return True
+        return get_compiled_validator(schema_name, validate_formats).is_valid(data)
     
     @staticmethod
-    def validate_multiple(data: Dict[str, Any], schemas: List[str]) -> Dict[str, Any]:
+    def validate_multiple(data: Dict[str, Any], schemas: List[str],
+                          hint: Optional[str] = None, parallel: bool = False,
+                          validate_formats: bool = False) -> Dict[str, Any]:
         """
         Validate data against multiple schemas.
         
         Args:
             data: Data to validate
             schemas: List of schema names to try
+            hint: Schema to try first (the given order is kept if omitted)
+            parallel: Probe the candidates on a thread pool (4+ schemas only)
+            validate_formats: Also assert "format" (date-time, email)
             
         Returns:
-            Dictionary with validation results
+            Dictionary with validation results. As before, "all_results"
+            holds the result for every schema tried, up to and including
+            the match.
         """
-        results = {}
+        if hint is not None and hint in schemas:
+            schemas = [hint] + [name for name in schemas if name != hint]
         
-        for schema_name in schemas:
-            result = SchemaValidator.validate(schema_name, data)
-            results[schema_name] = result
-            
-            if result["valid"]:
-                return {
-                    "valid": True,
-                    "matched_schema": schema_name,
-                    "all_results": results
-                }
+        if parallel and len(schemas) >= 4:
+            matched = SchemaValidator._probe_parallel(data, schemas, validate_formats)
+        else:
+            matched = next(
+                (name for name in schemas
+                 if SchemaValidator.is_valid(name, data, validate_formats)),
+                None
+            )
+        
+        # Full validation (with error details) only for the schemas that were tried
+        tried = schemas if matched is None else schemas[:schemas.index(matched)]
+        results = {
+            schema_name: SchemaValidator.validate(schema_name, data, validate_formats)
+            for schema_name in tried
+        }
+        
+        if matched is not None:
+            results[matched] = {"valid": True, "errors": [], "schema": matched}
+            return {
+                "valid": True,
+                "matched_schema": matched,
+                "all_results": results
+            }
         
         return {
             "valid": False,
@@ -394,71 +759,111 @@ class SchemaValidator:
             "all_results": results
         }
     
+    @staticmethod
+    def _probe_parallel(data: Any, schemas: List[str],
+                        validate_formats: bool = False) -> Optional[str]:
+        """First schema (in candidate order) that accepts data, probed concurrently"""
+        with ThreadPoolExecutor(max_workers=min(8, len(schemas))) as executor:
+            futures = [
+                executor.submit(SchemaValidator.is_valid, name, data, validate_formats)
+                for name in schemas
+            ]
+            try:
+                for schema_name, future in zip(schemas, futures):
+                    if future.result():
+                        return schema_name
+                return None
+            finally:
+                # Drop probes that haven't started once the outcome is known
+                for future in futures:
+                    future.cancel()
+    
     @staticmethod
     def generate_schema_example(schema_name: str) -> Dict[str, Any]:
         """Generate example data for a schema"""
         schema = SchemaValidator.get_schema(schema_name)
         
-        # Generate example based on schema structure
+        # Generate example based on schema structure; shared sub-schemas
+        # are only generated once
         example = {}
+        memo: Dict[int, Any] = {}
+        now = datetime.now().isoformat()
         
         if "properties" in schema:
             for prop_name, prop_schema in schema["properties"].items():
-                example[prop_name] = SchemaValidator._generate_example_value(prop_schema)
+                example[prop_name] = SchemaValidator._generate_example_value(prop_schema, memo, now)
         
         return example
     
     @staticmethod
-    def _generate_example_value(schema: Dict[str, Any]) -> Any:
-        """Generate example value for a schema property"""
-        if "type" not in schema:
-            return None
+    def _generate_example_value(schema: Dict[str, Any], memo: Optional[Dict[int, Any]] = None,
+                                now: Optional[str] = None) -> Any:
+        """
+        Generate example value for a schema property.
         
-        data_type = schema["type"]
+        Nested objects and arrays are walked with an explicit stack, and
+        values are memoized by schema identity in ``memo``. ``now`` is the
+        timestamp used for date-time strings.
+        """
+        if memo is None:
+            memo = {}
+        if now is None:
+            now = datetime.now().isoformat()
         
-        if data_type == "string":
-            if "format" in schema:
-                if schema["format"] == "date-time":
-                    return datetime.now().isoformat()
-                elif schema["format"] == "email":
-                    return "example@test.com"
+        result = [None]
+        # Each task fills target[key] with an example for its schema
+        stack = [(schema, result, 0)]
+        while stack:
+            node, target, key = stack.pop()
             
-            if "enum" in schema:
-                return schema["enum"][0]
+            if node is _FILL_ARRAY:
+                # Deferred array fill: key is (item holder, repeat count)
+                holder, count = key
+                target.extend(holder * count)
+                continue
             
-            if "pattern" in schema:
-                if schema["pattern"] == "^[A-Z0-9-]+$":
-                    return "SKU-12345"
-                elif schema["pattern"] == "^ORD-[0-9]{8}-[0-9]{6}$":
-                    return "ORD-20240115-123456"
+            if "$ref" in node:
+                node = _resolve_ref(node["$ref"])
             
-            return "example_string"
-        
-        elif data_type == "integer":
-            if "minimum" in schema:
-                return schema["minimum"]
-            return 1
-        
-        elif data_type == "number":
-            if "minimum" in schema:
-                return float(schema["minimum"] + 0.1)
-            return 10.5
-        
-        elif data_type == "boolean":
-            return True
-        
-        elif data_type == "array":
-            if "items" in schema:
-                item_example = SchemaValidator._generate_example_value(schema["items"])
-                return [item_example] * min(schema.get("minItems", 1), 3)
-            return []
-        
-        elif data_type == "object":
-            if "properties" in schema:
-                example = {}
-                for prop_name, prop_schema in schema["properties"].items():
-                    example[prop_name] = SchemaValidator._generate_example_value(prop_schema)
-                return example
-            return {}
+            value = memo.get(id(node), _MISSING)
+            if value is not _MISSING:
+                target[key] = value
+                continue
+            
+            data_type = node.get("type")
+            if data_type == "object":
+                properties = node.get("properties", {})
+                value = dict.fromkeys(properties)
+                for prop_name, prop_schema in properties.items():
+                    stack.append((prop_schema, value, prop_name))
+            elif data_type == "array":
+                value = []
+                if "items" in node:
+                    holder = [None]
+                    # The fill runs after the item (pushed last) is generated
+                    stack.append((_FILL_ARRAY, value, (holder, min(node.get("minItems", 1), 3))))
+                    stack.append((node["items"], holder, 0))
+            else:
+                handler = _EXAMPLE_HANDLERS.get(data_type)
+                value = handler(node, now) if handler is not None else None
+            
+            memo[id(node)] = value
+            target[key] = value
         
-        return None
\ No newline at end of file
+        return result[0]
+
+# Freeze the registered schemas now that the import-time scans are done;
+# the module-level schema dicts stay editable for callers that extend them
+_frozen: Dict[int, Any] = {}
+SCHEMA_REGISTRY.update(
+    (name, _freeze(schema, _frozen)) for name, schema in SCHEMA_REGISTRY.items()
+)
+del _frozen
+
+# Build the optional backends' validators at import so validation never pays for it
+if jsonschema_rs is not None:
+    for _schema_name in SCHEMA_REGISTRY:
+        get_rs_validator(_schema_name)
+elif fastjsonschema is not None:
+    for _schema_name in SCHEMA_REGISTRY:
+        get_fast_validator(_schema_name)
\ No newline at end of file
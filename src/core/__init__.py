@@ -3,15 +3,21 @@ Core framework components for the automation framework.
 Contains essential utilities, factories, and base classes.
 """
 
-from src.core.browser_factory import BrowserFactory, BrowserManager, BrowserType
-from src.core.api_client import APIClient
-from src.core.logger import TestLogger
-from src.core.utilities import (
-    TestUtilities,
-    DataGenerator,
-    PerformanceTimer,
-    FileHandler
-)
+import importlib
+
+# Exported names and their modules; imported on first attribute access
+# (PEP 562) so API-only users don't pay for selenium/webdriver_manager
+_LAZY = {
+    'BrowserFactory': 'src.core.browser_factory',
+    'BrowserManager': 'src.core.browser_factory',
+    'BrowserType': 'src.core.browser_factory',
+    'APIClient': 'src.core.api_client',
+    'TestLogger': 'src.core.logger',
+    'TestUtilities': 'src.core.utilities',
+    'DataGenerator': 'src.core.utilities',
+    'PerformanceTimer': 'src.core.utilities',
+    'FileHandler': 'src.core.utilities',
+}
 
 __all__ = [
     'BrowserFactory',
@@ -23,4 +29,18 @@ __all__ = [
     'DataGenerator',
     'PerformanceTimer',
     'FileHandler'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,121 +1,360 @@
 """
 Advanced API Client with authentication, retry logic, and request/response validation
 """
+import asyncio
 import json
+import logging
+import os
 import time
-from typing import Dict, Any, Optional, Union
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Union
+import httpx
 from src.core.logger import TestLogger
-from jsonschema import validate
+from jsonschema import Draft7Validator
+from src.api.schemas import CachedPatternValidator, get_compiled_validator
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON parser
+    orjson = None
 
 logger = TestLogger.get_logger(__name__)
 
+# Responses retried with exponential backoff (idempotent-enough methods only)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Keep-alive pool shared by all requests of a client
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+def _pretty(obj: Any) -> str:
+    """Indented JSON for debug logs"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:
+            # e.g. non-string keys or integers beyond 64 bits
+            pass
+    try:
+        return json.dumps(obj, indent=2, sort_keys=True)
+    except TypeError:
+        # Keys of mixed types can't be sorted; debug logging must not fail the request
+        return json.dumps(obj, indent=2, default=str)
+
+
+# requests keyword arguments that httpx only accepts when the client is built
+_CLIENT_ONLY_KWARGS = frozenset({"verify", "cert", "proxies", "stream", "hooks"})
+
+
+def _translate_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Map requests-style keyword arguments onto their httpx equivalents"""
+    unsupported = _CLIENT_ONLY_KWARGS.intersection(kwargs)
+    if unsupported:
+        raise TypeError(
+            f"Per-request {', '.join(sorted(unsupported))} is not supported by the httpx client; "
+            "configure the client instead (e.g. APIClient(..., verify=False))"
+        )
+    if "allow_redirects" in kwargs:
+        kwargs["follow_redirects"] = kwargs.pop("allow_redirects")
+    if isinstance(kwargs.get("data"), (str, bytes)):
+        # httpx takes raw bodies as content=; data= is for form fields
+        kwargs["content"] = kwargs.pop("data")
+    return kwargs
+
+
+@dataclass(slots=True, frozen=True)
+class PostmanTest:
+    """Single request imported from a Postman collection"""
+    name: str
+    method: str
+    url: str
+    headers: list
+    body: dict
+    tests: list
+
+
+@lru_cache(maxsize=16)
+def _load_collection(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a Postman collection; keyed on mtime so edited files are re-read"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 class APIClient:
     """Advanced API Client with built-in retry, validation, and logging"""
     
-    def __init__(self, base_url: str, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, base_url: str, timeout: int = 30, max_retries: int = 3,
+                 verify: Union[bool, str] = True):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
+        self.max_retries = max_retries
+        self.verify = verify
+        self.backoff_factor = 1
         self.token = None
+        # Compiled validators keyed by schema identity: id -> (schema, validator)
+        self._validators: Dict[int, tuple] = {}
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
+        # HTTP/2 client with a pooled transport; the transport retries
+        # failed connections, request() retries on RETRY_STATUSES
+        self.session = self._create_session()
+    
+    def _create_session(self) -> httpx.Client:
+        """Create the underlying HTTP client"""
+        return httpx.Client(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=DEFAULT_HEADERS,
+            # requests followed redirects by default; httpx does not
+            follow_redirects=True,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=self.verify,
+                limits=POOL_LIMITS,
+                retries=self.max_retries
+            )
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Default headers
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+    
+    def close(self):
+        """Close pooled connections"""
+        self.session.close()
+    
+    def __enter__(self) -> 'APIClient':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def set_auth_token(self, token: str):
         """Set authentication token"""
         self.token = token
         self.session.headers.update({"Authorization": f"Bearer {token}"})
     
-    def validate_schema(self, response_data: Dict[str, Any], schema: Dict[str, Any]):
-        """Validate response against JSON schema"""
+    def _get_validator(self, schema: Union[str, Dict[str, Any]]) -> Draft7Validator:
+        """Return a compiled validator for a schema dict or registered schema name"""
+        if isinstance(schema, str):
+            return get_compiled_validator(schema)
+        
+        cached = self._validators.get(id(schema))
+        # Keep the schema alongside its validator so a recycled id can't match
+        if cached is None or cached[0] is not schema:
+            cached = (schema, CachedPatternValidator(schema))
+            self._validators[id(schema)] = cached
+        return cached[1]
+    
+    def validate_schema(self, response_data: Dict[str, Any], schema: Union[str, Dict[str, Any]]):
+        """Validate response against JSON schema (a schema dict or registry name)"""
         try:
-            validate(instance=response_data, schema=schema)
-            logger.info("Response validation successful")
-            return True
+            error = next(self._get_validator(schema).iter_errors(response_data), None)
         except Exception as e:
             logger.error(f"Schema validation failed: {e}")
             return False
+        
+        if error is not None:
+            logger.error(f"Schema validation failed: {error}")
+            return False
+        
+        logger.info("Response validation successful")
+        return True
+    
+    def _log_request(self, method: str, url: str, kwargs: Dict[str, Any], debug_enabled: bool):
+        """Log an outgoing request"""
+        logger.info("Making %s request to %s", method, url)
+        if debug_enabled and kwargs.get('json'):
+            logger.debug(f"Request payload: {_pretty(kwargs['json'])}")
+    
+    def _cache_json(self, response: httpx.Response):
+        """Decode a JSON body once so later response.json() calls reuse it"""
+        if not response.headers.get('content-type', '').startswith('application/json'):
+            return
+        try:
+            parsed = orjson.loads(response.content) if orjson is not None else response.json()
+        except ValueError:
+            # Leave response.json() to raise for callers that need it
+            return
+        response.json = lambda **kwargs: parsed
     
-    def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def _log_response(self, response: httpx.Response, debug_enabled: bool):
+        """Log a received response"""
+        logger.info("Response status: %s", response.status_code)
+        if debug_enabled and response.text:
+            try:
+                logger.debug(f"Response body: {_pretty(response.json())}")
+            except ValueError:
+                logger.debug(f"Response text: {response.text[:500]}")
+    
+    def _retry_delay(self, method: str, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response is final"""
+        if (attempt >= self.max_retries
+                or method.upper() not in RETRY_METHODS
+                or response.status_code not in RETRY_STATUSES):
+            return None
+        
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * (2 ** attempt)
+    
+    def request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Make HTTP request with enhanced logging and error handling"""
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        kwargs = _translate_kwargs(kwargs)
+        
+        # Body dumps are only built when DEBUG records will be emitted
+        debug_enabled = logger.logger.isEnabledFor(logging.DEBUG)
         
-        # Log request
-        logger.info(f"Making {method} request to {url}")
-        if kwargs.get('json'):
-            logger.debug(f"Request payload: {json.dumps(kwargs['json'], indent=2)}")
+        self._log_request(method, url, kwargs, debug_enabled)
         
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                timeout=self.timeout,
-                **kwargs
-            )
+            attempt = 0
+            while True:
+                response = self.session.request(method, url, **kwargs)
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+                attempt += 1
+                logger.warning("Retrying %s %s after status %s (%s/%s)", method, url, response.status_code, attempt, self.max_retries)
+                time.sleep(delay)
             
-            # Log response
-            logger.info(f"Response status: {response.status_code}")
-            if response.text:
-                try:
-                    logger.debug(f"Response body: {json.dumps(response.json(), indent=2)}")
-                except:
-                    logger.debug(f"Response text: {response.text[:500]}")
+            self._cache_json(response)
+            self._log_response(response, debug_enabled)
             
-            # Raise for status
-            response.raise_for_status()
+            # Raise for 4xx/5xx only; httpx would also raise for an
+            # unfollowed 3xx, which requests returned as-is
+            if response.is_error:
+                response.raise_for_status()
             
             return response
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request failed: {e}")
             raise
     
-    def get(self, endpoint: str, **kwargs) -> requests.Response:
+    def get(self, endpoint: str, **kwargs) -> httpx.Response:
         return self.request("GET", endpoint, **kwargs)
     
-    def post(self, endpoint: str, **kwargs) -> requests.Response:
+    def post(self, endpoint: str, **kwargs) -> httpx.Response:
         return self.request("POST", endpoint, **kwargs)
     
-    def put(self, endpoint: str, **kwargs) -> requests.Response:
+    def put(self, endpoint: str, **kwargs) -> httpx.Response:
         return self.request("PUT", endpoint, **kwargs)
     
-    def delete(self, endpoint: str, **kwargs) -> requests.Response:
+    def delete(self, endpoint: str, **kwargs) -> httpx.Response:
         return self.request("DELETE", endpoint, **kwargs)
     
-    def postman_import(self, postman_collection_path: str):
-        """Import and convert Postman collection to test cases"""
-        import json
-        with open(postman_collection_path, 'r') as f:
-            collection = json.load(f)
+    def postman_import(self, postman_collection_path: str) -> Iterator[PostmanTest]:
+        """Import Postman collection, yielding one test case at a time"""
+        collection = _load_collection(
+            postman_collection_path, os.path.getmtime(postman_collection_path)
+        )
         
-        tests = []
         for item in collection.get('item', []):
-            test_case = {
-                'name': item['name'],
-                'method': item['request']['method'],
-                'url': item['request']['url']['raw'],
-                'headers': item['request'].get('header', []),
-                'body': item['request'].get('body', {}),
-                'tests': item.get('event', [])
-            }
-            tests.append(test_case)
-        
+            request = item['request']
+            yield PostmanTest(
+                item['name'],
+                request['method'],
+                request['url']['raw'],
+                request.get('header', []),
+                request.get('body', {}),
+                item.get('event', [])
+            )
+    
+    def postman_import_list(self, postman_collection_path: str) -> List[Dict[str, Any]]:
+        """Import and convert Postman collection to a list of test case dicts (the original format)"""
+        # asdict() deep-copies, so callers can't modify the cached collection
+        tests = [asdict(test) for test in self.postman_import(postman_collection_path)]
         logger.info(f"Imported {len(tests)} tests from Postman collection")
-        return tests
\ No newline at end of file
+        return tests
+
+
+class AsyncAPIClient(APIClient):
+    """
+    Asynchronous variant of APIClient built on httpx.AsyncClient.
+    Independent calls can be run concurrently with asyncio.gather().
+    """
+    
+    def _create_session(self) -> httpx.AsyncClient:
+        """Create the underlying asynchronous HTTP client"""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            headers=DEFAULT_HEADERS,
+            # requests followed redirects by default; httpx does not
+            follow_redirects=True,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                verify=self.verify,
+                limits=POOL_LIMITS,
+                retries=self.max_retries
+            )
+        )
+    
+    async def close(self):
+        """Close pooled connections"""
+        await self.session.aclose()
+    
+    def __enter__(self):
+        raise TypeError("AsyncAPIClient must be used with 'async with', not 'with'")
+    
+    def __exit__(self, *exc_info):
+        # Never reached: __enter__ always raises
+        pass
+    
+    async def __aenter__(self) -> 'AsyncAPIClient':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Make HTTP request with enhanced logging and error handling"""
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        kwargs = _translate_kwargs(kwargs)
+        
+        # Body dumps are only built when DEBUG records will be emitted
+        debug_enabled = logger.logger.isEnabledFor(logging.DEBUG)
+        
+        self._log_request(method, url, kwargs, debug_enabled)
+        
+        try:
+            attempt = 0
+            while True:
+                response = await self.session.request(method, url, **kwargs)
+                delay = self._retry_delay(method, response, attempt)
+                if delay is None:
+                    break
+                attempt += 1
+                logger.warning("Retrying %s %s after status %s (%s/%s)", method, url, response.status_code, attempt, self.max_retries)
+                await asyncio.sleep(delay)
+            
+            self._cache_json(response)
+            self._log_response(response, debug_enabled)
+            
+            # Raise for 4xx/5xx only; httpx would also raise for an
+            # unfollowed 3xx, which requests returned as-is
+            if response.is_error:
+                response.raise_for_status()
+            
+            return response
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Request failed: {e}")
+            raise
+    
+    async def get(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", endpoint, **kwargs)
+    
+    async def post(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", endpoint, **kwargs)
+    
+    async def put(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", endpoint, **kwargs)
+    
+    async def delete(self, endpoint: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", endpoint, **kwargs)
\ No newline at end of file
@@ -1,13 +1,17 @@
 """
 Advanced Browser Factory supporting multiple browsers and configurations
 """
+import os
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
@@ -15,6 +19,19 @@ from src.core.logger import TestLogger
 
 logger = TestLogger.get_logger(__name__)
 
+# Keep downloaded drivers in the project (.wdm) so CI can cache them
+os.environ.setdefault("WDM_LOCAL", "1")
+
+# Arguments applied to every Chromium-based driver (Chrome, Edge)
+_BASE_OPTIONS_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--window-size=1920,1080",
+    "--disable-blink-features=AutomationControlled",
+)
+_EXCLUDE_SWITCHES = ("enable-automation", "enable-logging")
+
 class BrowserType(Enum):
     CHROME = "chrome"
     FIREFOX = "firefox"
@@ -31,6 +48,12 @@ class BrowserFactory(ABC):
 class ChromeBrowserFactory(BrowserFactory):
     """Chrome Browser Factory"""
     
+    # Pinned chromedriver version; skips webdriver_manager's latest-version lookup
+    CHROMEDRIVER_VERSION: Optional[str] = os.getenv("CHROMEDRIVER_VERSION")
+    
+    # Resolved chromedriver path, shared by all drivers of this process
+    _driver_path: Optional[str] = None
+    
     def create_driver(self, headless: bool = False, options: Optional[ChromeOptions] = None):
         if options is None:
             options = ChromeOptions()
@@ -39,12 +62,9 @@ class ChromeBrowserFactory(BrowserFactory):
             options.add_argument("--headless")
         
         # Performance and reliability options
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+        for argument in _BASE_OPTIONS_ARGS:
+            options.add_argument(argument)
+        options.add_experimental_option("excludeSwitches", list(_EXCLUDE_SWITCHES))
         options.add_experimental_option("useAutomationExtension", False)
         
         # Mobile emulation (optional)
@@ -54,8 +74,13 @@ class ChromeBrowserFactory(BrowserFactory):
         }
         # options.add_experimental_option("mobileEmulation", mobile_emulation)
         
+        if ChromeBrowserFactory._driver_path is None:
+            ChromeBrowserFactory._driver_path = ChromeDriverManager(
+                driver_version=ChromeBrowserFactory.CHROMEDRIVER_VERSION
+            ).install()
+        
         driver = webdriver.Chrome(
-            executable_path=ChromeDriverManager().install(),
+            service=ChromeService(executable_path=ChromeBrowserFactory._driver_path),
             options=options
         )
         
@@ -69,6 +94,9 @@ class ChromeBrowserFactory(BrowserFactory):
 class FirefoxBrowserFactory(BrowserFactory):
     """Firefox Browser Factory"""
     
+    # Resolved geckodriver path, shared by all drivers of this process
+    _driver_path: Optional[str] = None
+    
     def create_driver(self, headless: bool = False, options: Optional[FirefoxOptions] = None):
         if options is None:
             options = FirefoxOptions()
@@ -79,32 +107,63 @@ class FirefoxBrowserFactory(BrowserFactory):
         options.set_preference("dom.webdriver.enabled", False)
         options.set_preference("useAutomationExtension", False)
         
+        if FirefoxBrowserFactory._driver_path is None:
+            FirefoxBrowserFactory._driver_path = GeckoDriverManager().install()
+        
         driver = webdriver.Firefox(
-            executable_path=GeckoDriverManager().install(),
+            service=FirefoxService(executable_path=FirefoxBrowserFactory._driver_path),
             options=options
         )
         
         logger.info("Firefox driver created")
         return driver
 
+class EdgeBrowserFactory(BrowserFactory):
+    """Edge Browser Factory"""
+    
+    # Resolved msedgedriver path, shared by all drivers of this process
+    _driver_path: Optional[str] = None
+    
+    def create_driver(self, headless: bool = False, options: Optional[EdgeOptions] = None):
+        if options is None:
+            options = EdgeOptions()
+        
+        if headless:
+            options.add_argument("--headless")
+        
+        # Performance and reliability options
+        for argument in _BASE_OPTIONS_ARGS:
+            options.add_argument(argument)
+        options.add_experimental_option("excludeSwitches", list(_EXCLUDE_SWITCHES))
+        options.add_experimental_option("useAutomationExtension", False)
+        
+        if EdgeBrowserFactory._driver_path is None:
+            EdgeBrowserFactory._driver_path = EdgeChromiumDriverManager().install()
+        
+        driver = webdriver.Edge(
+            service=EdgeService(executable_path=EdgeBrowserFactory._driver_path),
+            options=options
+        )
+        
+        logger.info("Edge driver created")
+        return driver
+
+# Factories are stateless, so one instance per browser is shared
+_FACTORIES: Dict[BrowserType, BrowserFactory] = {
+    BrowserType.CHROME: ChromeBrowserFactory(),
+    BrowserType.FIREFOX: FirefoxBrowserFactory(),
+    BrowserType.EDGE: EdgeBrowserFactory(),
+}
+
 class BrowserManager:
     """Browser Manager to handle browser creation and management"""
     
     @staticmethod
     def get_browser_factory(browser_type: BrowserType) -> BrowserFactory:
-        factories = {
-            BrowserType.CHROME: ChromeBrowserFactory(),
-            BrowserType.FIREFOX: FirefoxBrowserFactory(),
-            BrowserType.EDGE: lambda: webdriver.Edge(
-                executable_path=EdgeChromiumDriverManager().install()
-            ),
-        }
-        
-        factory = factories.get(browser_type)
-        if not factory:
-            raise ValueError(f"Unsupported browser type: {browser_type}")
-        
-        return factory
+        try:
+            return _FACTORIES[browser_type]
+        except KeyError:
+            raise ValueError(f"Unsupported browser type: {browser_type}") from None
     
     @staticmethod
     def create_driver(browser_type: BrowserType = BrowserType.CHROME, **kwargs):
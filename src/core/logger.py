@@ -2,15 +2,43 @@
 Advanced logging configuration for the test framework.
 Supports multiple log levels, file rotation, and structured logging.
 """
+import atexit
+import copy
 import logging
+import queue
 import sys
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from typing import Optional, Dict, Any, List, Tuple, Union
+from logging.handlers import (
+    MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+)
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON serializer
+    orjson = None
+
+
+# None of the framework's formats use processName, so skip resolving
+# multiprocessing.current_process() for every record
+logging.logMultiprocessing = False
+
+_LEVELS = {name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}
+
+
+def _to_level(level: Union[str, int]) -> int:
+    """Resolve a level name such as 'info' (or an int level) to its number"""
+    if isinstance(level, int):
+        return level
+    return _LEVELS[level.upper()]
+
+
+# Attributes every LogRecord carries; anything else on a record came from `extra=`
+_STD = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
@@ -18,7 +46,8 @@ class StructuredFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON"""
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            # Serialized to ISO 8601 by orjson (or isoformat() in the fallback)
+            "timestamp": datetime.fromtimestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -26,21 +55,47 @@ class StructuredFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno,
             "process": record.process,
-            "thread": record.threadName
+            "thread": record.thread
         }
         
-        # Add exception info if present
+        # Add exception info if present, reusing the traceback text another
+        # handler's formatter has already rendered for this record
         if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_entry["exception"] = record.exc_text
         
         # Add extra fields
-        if hasattr(record, 'extra'):
-            log_entry.update(record.extra)
+        for key, value in record.__dict__.items():
+            if key not in _STD:
+                log_entry[key] = value
+        
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_entry, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            except TypeError:
+                # e.g. integers beyond 64 bits; let json handle the record
+                pass
         
+        log_entry["timestamp"] = log_entry["timestamp"].isoformat()
         return json.dumps(log_entry, default=str)
 
 
-class ColorFormatter(logging.Formatter):
+class CachedFormatter(logging.Formatter):
+    """Formatter that inspects its format string once instead of per record"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._uses_time = self._style.usesTime()
+    
+    def usesTime(self) -> bool:
+        """Whether the format needs asctime (searched for once at construction)"""
+        return self._uses_time
+
+
+class ColorFormatter(CachedFormatter):
     """Color formatter for console output"""
     
     COLORS = {
@@ -52,12 +107,119 @@ class ColorFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._reset = self.COLORS['RESET']
+        self._prefix = {level: color for level, color in self.COLORS.items() if level != 'RESET'}
+        if not self.colors_enabled():
+            # Plain output: format records without the color wrapper at all
+            self.format = super().format
+    
+    @staticmethod
+    def colors_enabled() -> bool:
+        """Whether console output should be colored (NO_COLOR / FORCE_COLOR aware)"""
+        if os.environ.get("NO_COLOR"):
+            return False
+        if os.environ.get("FORCE_COLOR"):
+            return True
+        # ANSI codes only help an interactive terminal; CI logs and redirects get plain text
+        return sys.stdout is not None and sys.stdout.isatty()
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
-        level_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        
         formatted = super().format(record)
-        return f"{level_color}{formatted}{self.COLORS['RESET']}"
+        return self._prefix.get(record.levelname, self._reset) + formatted + self._reset
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting (but not message rendering) to the listener thread"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshot the record's mutable state before it is enqueued.
+        
+        The message is rendered and `extra=` values are copied here, so a
+        caller mutating its arguments after logging can't change what is
+        written. Timestamps, layout and tracebacks are still formatted by
+        the real handlers on the listener thread (the queue never leaves the
+        process, so exc_info need not be made picklable).
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        for key, value in record.__dict__.items():
+            if key not in _STD:
+                try:
+                    record.__dict__[key] = copy.deepcopy(value)
+                except Exception:
+                    # e.g. locks or open files; fall back to their current text
+                    record.__dict__[key] = str(value)
+        return record
+
+
+class BufferedHandler(MemoryHandler):
+    """
+    Buffers records for a file handler and writes them out in small batches.
+    
+    A WARNING or worse flushes the buffer at once, so at most ``capacity``
+    routine records are lost if the process dies without running atexit.
+    """
+    
+    def __init__(self, target: logging.Handler, capacity: int = 64):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=target, flushOnClose=True)
+    
+    def emit(self, record: logging.LogRecord):
+        """Buffer the record if the target handler would accept it"""
+        if record.levelno >= self.target.level:
+            super().emit(record)
+
+
+class ConsoleHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing of routine records to the stream's own buffering"""
+    
+    def emit(self, record: logging.LogRecord):
+        """Write the record, flushing only for warnings and above"""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Log directories already created by this process
+_CREATED_DIRS = set()
+
+# Handlers, listener and queue handler per (log_dir, name), shared by every
+# TestLogger writing to the same files
+_HANDLER_CACHE: Dict[Tuple[str, str], Tuple[List[logging.Handler], QueueListener, QueueHandler]] = {}
+
+
+def _release_handlers(key: Tuple[str, str]):
+    """Stop a cached listener, write out buffered records and close its files"""
+    entry = _HANDLER_CACHE.pop(key, None)
+    if entry is None:
+        return
+    handlers, listener, _ = entry
+    listener.stop()
+    for handler in handlers:
+        target = getattr(handler, 'target', None)
+        try:
+            handler.flush()
+            handler.close()
+            if target is not None:
+                target.close()
+        except (OSError, ValueError):
+            # Stream already closed (e.g. a replaced sys.stdout); same as logging.shutdown()
+            pass
+
+
+@atexit.register
+def _release_all_handlers():
+    for key in list(_HANDLER_CACHE):
+        _release_handlers(key)
 
 
 class TestLogger:
@@ -68,13 +230,16 @@ class TestLogger:
     
     _loggers: Dict[str, 'TestLogger'] = {}
     
-    def __init__(self, name: str, log_dir: str = "logs", level: str = "INFO"):
+    def __init__(self, name: str, log_dir: str = "logs", level: Union[str, int] = "INFO"):
         self.name = name
         self.log_dir = Path(log_dir)
-        self.level = getattr(logging, level.upper())
+        self._log_dir = os.path.normpath(os.fspath(log_dir))
+        self.level = _to_level(level)
         
         # Create log directory if it doesn't exist
-        self.log_dir.mkdir(exist_ok=True)
+        if self._log_dir not in _CREATED_DIRS:
+            os.makedirs(self._log_dir, exist_ok=True)
+            _CREATED_DIRS.add(self._log_dir)
         
         # Initialize logger
         self.logger = logging.getLogger(name)
@@ -83,6 +248,8 @@ class TestLogger:
         
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
+        self._key = (self._log_dir, name)
+        self._handlers = []
         
         # Add handlers
         self._setup_handlers()
@@ -95,18 +262,27 @@ class TestLogger:
         return cls._loggers[name]
     
     def _setup_handlers(self):
-        """Setup logging handlers"""
+        """Setup logging handlers behind a background queue listener"""
+        cached = _HANDLER_CACHE.get(self._key)
+        if cached is None:
+            cached = _HANDLER_CACHE[self._key] = self._create_handlers()
+        self._handlers, _, queue_handler = cached
+        self.logger.addHandler(queue_handler)
+    
+    def _create_handlers(self):
+        """Open the log files and start the queue listener that serves them"""
+        handlers = []
         
         # Console handler with colors
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = ConsoleHandler(sys.stdout)
         console_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         console_formatter = ColorFormatter(console_format, datefmt='%Y-%m-%d %H:%M:%S')
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(logging.INFO)
-        self.logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler for all logs (rotating)
-        log_file = self.log_dir / f"{self.name}.log"
+        log_file = os.path.join(self._log_dir, f"{self.name}.log")
         file_handler = RotatingFileHandler(
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10MB
@@ -114,27 +290,26 @@ class TestLogger:
             encoding='utf-8'
         )
         file_format = '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(funcName)s:%(lineno)d - %(message)s'
-        file_formatter = logging.Formatter(file_format, datefmt='%Y-%m-%d %H:%M:%S')
+        file_formatter = CachedFormatter(file_format, datefmt='%Y-%m-%d %H:%M:%S')
         file_handler.setFormatter(file_formatter)
         file_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
+        handlers.append(BufferedHandler(file_handler))
         
         # JSON handler for structured logging
-        json_file = self.log_dir / f"{self.name}_structured.json"
-        json_handler = TimedRotatingFileHandler(
+        json_file = os.path.join(self._log_dir, f"{self.name}_structured.json")
+        json_handler = RotatingFileHandler(
             json_file,
-            when='midnight',
-            interval=1,
+            maxBytes=50 * 1024 * 1024,  # 50MB
             backupCount=7,
             encoding='utf-8'
         )
         json_formatter = StructuredFormatter()
         json_handler.setFormatter(json_formatter)
         json_handler.setLevel(logging.INFO)
-        self.logger.addHandler(json_handler)
+        handlers.append(BufferedHandler(json_handler))
         
         # Error handler for errors only
-        error_file = self.log_dir / f"{self.name}_error.log"
+        error_file = os.path.join(self._log_dir, f"{self.name}_error.log")
         error_handler = RotatingFileHandler(
             error_file,
             maxBytes=5 * 1024 * 1024,  # 5MB
@@ -143,19 +318,33 @@ class TestLogger:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(file_formatter)
-        self.logger.addHandler(error_handler)
+        handlers.append(error_handler)
+        
+        # Callers only enqueue records; formatting and I/O happen on the
+        # listener thread
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        return handlers, listener, DeferredQueueHandler(log_queue)
+    
+    def _all_handlers(self):
+        """Handlers served by the listener followed by those on the logger"""
+        handlers = [getattr(handler, 'target', handler) for handler in self._handlers]
+        return handlers + self.logger.handlers
     
-    def set_level(self, level: str):
+    def set_level(self, level: Union[str, int]):
         """Set logging level"""
-        self.level = getattr(logging, level.upper())
+        self.level = _to_level(level)
         self.logger.setLevel(self.level)
-        for handler in self.logger.handlers:
+        for handler in self._all_handlers():
             if isinstance(handler, logging.StreamHandler):
                 handler.setLevel(self.level)
     
     def log_test_start(self, test_name: str, test_data: Dict[str, Any] = None):
         """Log test execution start"""
-        self.logger.info(f"Starting test: {test_name}", extra={
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Starting test: %s", test_name, extra={
             "event": "test_start",
             "test_name": test_name,
             "test_data": test_data or {}
@@ -163,7 +352,9 @@ class TestLogger:
     
     def log_test_end(self, test_name: str, status: str, duration: float = None):
         """Log test execution end"""
-        self.logger.info(f"Test {status}: {test_name}", extra={
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Test %s: %s", status, test_name, extra={
             "event": "test_end",
             "test_name": test_name,
             "status": status,
@@ -172,7 +363,9 @@ class TestLogger:
     
     def log_api_call(self, method: str, url: str, status_code: int, duration: float):
         """Log API call details"""
-        self.logger.info(f"API {method} {url} - {status_code} ({duration:.2f}s)", extra={
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("API %s %s - %s (%.2fs)", method, url, status_code, duration, extra={
             "event": "api_call",
             "method": method,
             "url": url,
@@ -182,7 +375,9 @@ class TestLogger:
     
     def log_page_load(self, url: str, duration: float):
         """Log page load details"""
-        self.logger.info(f"Page loaded: {url} ({duration:.2f}s)", extra={
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Page loaded: %s (%.2fs)", url, duration, extra={
             "event": "page_load",
             "url": url,
             "duration": duration
@@ -190,15 +385,22 @@ class TestLogger:
     
     def log_element_interaction(self, action: str, locator: tuple, success: bool):
         """Log element interaction"""
-        self.logger.debug(f"Element {action}: {locator} - {'Success' if success else 'Failed'}", extra={
+        # Called in tight UI loops: a plain level compare is the cheapest check
+        if self.level > logging.DEBUG:
+            return
+        self.logger.debug("Element %s: %s - %s", action, locator, 'Success' if success else 'Failed', extra={
             "event": "element_interaction",
             "action": action,
-            "locator": str(locator),
+            "locator": locator,
             "success": success
         })
     
     def log_performance(self, metric: str, value: float, threshold: float = None):
         """Log performance metric"""
+        exceeded = threshold is not None and value > threshold
+        if self.level > (logging.WARNING if exceeded else logging.INFO):
+            return
+        
         extra = {
             "event": "performance",
             "metric": metric,
@@ -209,16 +411,18 @@ class TestLogger:
             extra["threshold"] = threshold
             extra["within_limit"] = value <= threshold
             
-            if value > threshold:
-                self.logger.warning(f"Performance threshold exceeded: {metric}={value:.2f} > {threshold}", extra=extra)
+            if exceeded:
+                self.logger.warning("Performance threshold exceeded: %s=%.2f > %s", metric, value, threshold, extra=extra)
             else:
-                self.logger.info(f"Performance OK: {metric}={value:.2f} <= {threshold}", extra=extra)
+                self.logger.info("Performance OK: %s=%.2f <= %s", metric, value, threshold, extra=extra)
         else:
-            self.logger.info(f"Performance: {metric}={value:.2f}", extra=extra)
+            self.logger.info("Performance: %s=%.2f", metric, value, extra=extra)
     
     def log_security_event(self, event_type: str, details: Dict[str, Any]):
         """Log security-related event"""
-        self.logger.warning(f"Security event: {event_type}", extra={
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning("Security event: %s", event_type, extra={
             "event": "security",
             "event_type": event_type,
             "details": details
@@ -226,7 +430,9 @@ class TestLogger:
     
     def capture_screenshot_info(self, filename: str, reason: str):
         """Log screenshot capture information"""
-        self.logger.info(f"Screenshot saved: {filename}", extra={
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info("Screenshot saved: %s", filename, extra={
             "event": "screenshot",
             "filename": filename,
             "reason": reason
@@ -234,7 +440,9 @@ class TestLogger:
     
     def log_bug_report(self, bug_id: str, test_name: str, error: str):
         """Log bug report creation"""
-        self.logger.error(f"Bug report created: {bug_id} for test {test_name}", extra={
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        self.logger.error("Bug report created: %s for test %s", bug_id, test_name, extra={
             "event": "bug_report",
             "bug_id": bug_id,
             "test_name": test_name,
@@ -242,42 +450,51 @@ class TestLogger:
         })
     
     # Convenience methods
-    def debug(self, msg: str, **kwargs):
+    def debug(self, msg: str, *args, **kwargs):
         """Log debug message"""
-        self.logger.debug(msg, extra=kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, extra=kwargs or None)
     
-    def info(self, msg: str, **kwargs):
+    def info(self, msg: str, *args, **kwargs):
         """Log info message"""
-        self.logger.info(msg, extra=kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(msg, *args, extra=kwargs or None)
     
-    def warning(self, msg: str, **kwargs):
+    def warning(self, msg: str, *args, **kwargs):
         """Log warning message"""
-        self.logger.warning(msg, extra=kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(msg, *args, extra=kwargs or None)
     
-    def error(self, msg: str, **kwargs):
+    def error(self, msg: str, *args, **kwargs):
         """Log error message"""
-        self.logger.error(msg, extra=kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(msg, *args, extra=kwargs or None)
     
-    def critical(self, msg: str, **kwargs):
+    def critical(self, msg: str, *args, **kwargs):
         """Log critical message"""
-        self.logger.critical(msg, extra=kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(msg, *args, extra=kwargs or None)
     
-    def exception(self, msg: str, exc_info: bool = True, **kwargs):
+    def exception(self, msg: str, *args, exc_info: bool = True, **kwargs):
         """Log exception with traceback"""
-        self.logger.exception(msg, exc_info=exc_info, extra=kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.exception(msg, *args, exc_info=exc_info, extra=kwargs or None)
     
     def get_log_file_path(self, handler_type: str = "file") -> Optional[Path]:
         """Get log file path for specific handler"""
-        for handler in self.logger.handlers:
-            if isinstance(handler, RotatingFileHandler) and handler_type == "file":
-                return Path(handler.baseFilename)
-            elif isinstance(handler, TimedRotatingFileHandler) and handler_type == "json":
+        for handler in self._all_handlers():
+            if not isinstance(handler, RotatingFileHandler):
+                continue
+            is_json = isinstance(handler.formatter, StructuredFormatter)
+            if (handler_type == "file" and not is_json) or (handler_type == "json" and is_json):
                 return Path(handler.baseFilename)
         return None
     
     def clear_handlers(self):
         """Clear all logging handlers"""
         self.logger.handlers.clear()
+        _release_handlers(self._key)
+        self._handlers = []
     
     def add_custom_handler(self, handler: logging.Handler):
         """Add custom logging handler"""
@@ -5,7 +5,6 @@ import pytest
 import allure
 import json
 from src.core.api_client import APIClient
-from src.api.schemas import USER_SCHEMA, AUTH_RESPONSE_SCHEMA
 
 @allure.epic("API Testing")
 @allure.feature("Authentication API")
@@ -39,7 +38,7 @@ class TestAuthAPI:
         
         with allure.step("Verify response schema"):
             response_data = response.json()
-            assert self.client.validate_schema(response_data, AUTH_RESPONSE_SCHEMA)
+            assert self.client.validate_schema(response_data, "auth_response")
         
         with allure.step("Verify response contains token"):
             assert "token" in response_data
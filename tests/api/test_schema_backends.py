@@ -0,0 +1,64 @@
+"""
+Schema validator backend tests.
+Checks that the optional jsonschema_rs backend is actually used when installed.
+"""
+import pytest
+import allure
+from src.api import schemas
+from src.api.schemas import SCHEMA_REGISTRY, SchemaValidator, get_rs_validator
+
+jsonschema_rs = pytest.importorskip("jsonschema_rs")
+
+# Schemas using draft-4 style "exclusiveMinimum": true, which Draft 7 rejects
+DRAFT4_SCHEMAS = {"product", "product_list"}
+RS_SCHEMAS = sorted(set(SCHEMA_REGISTRY) - DRAFT4_SCHEMAS)
+
+
+@allure.epic("API Testing")
+@allure.feature("Schema Validation")
+@allure.story("jsonschema_rs Backend")
+class TestRustSchemaBackend:
+    """Test class for the jsonschema_rs validator backend"""
+    
+    @allure.title("Test every registered schema compiles with jsonschema_rs")
+    @pytest.mark.api
+    @pytest.mark.parametrize("schema_name", RS_SCHEMAS + [
+        pytest.param(name, marks=pytest.mark.xfail(strict=True, reason="draft-4 exclusiveMinimum"))
+        for name in sorted(DRAFT4_SCHEMAS)
+    ])
+    def test_schema_compiles(self, schema_name):
+        """Test that no registered schema silently falls back to a slower backend"""
+        assert get_rs_validator(schema_name) is not None
+        assert get_rs_validator(schema_name, validate_formats=True) is not None
+    
+    @allure.title("Test jsonschema_rs agrees with jsonschema on generated examples")
+    @pytest.mark.api
+    @pytest.mark.parametrize("schema_name", RS_SCHEMAS)
+    def test_matches_reference_validator(self, schema_name):
+        """Test the Rust backend against the pure-Python reference validator"""
+        example = SchemaValidator.generate_schema_example(schema_name)
+        # Null out the first property to get a (usually) invalid document too
+        broken = dict(example, **{next(iter(example)): None})
+        
+        for data in (example, broken):
+            expected = schemas.get_compiled_validator(schema_name).is_valid(data)
+            assert get_rs_validator(schema_name).is_valid(data) == expected
+    
+    @allure.title("Test a rejected schema is logged before falling back")
+    @pytest.mark.api
+    def test_fallback_is_logged(self, monkeypatch):
+        """Test that the jsonschema_rs fallback is not silent"""
+        def reject(*args, **kwargs):
+            raise ValueError("unsupported keyword")
+        
+        messages = []
+        monkeypatch.setattr(jsonschema_rs, "Draft7Validator", reject)
+        monkeypatch.setattr(schemas.logger, "debug", messages.append)
+        get_rs_validator.cache_clear()
+        try:
+            assert get_rs_validator("user") is None
+        finally:
+            get_rs_validator.cache_clear()
+        
+        assert len(messages) == 1
+        assert "'user'" in messages[0] and "unsupported keyword" in messages[0]
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Unit test package for the automation framework.
+Contains offline tests for schemas, the API client and core utilities.
+"""
\ No newline at end of file
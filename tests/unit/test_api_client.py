@@ -0,0 +1,166 @@
+"""
+API client unit tests.
+Tests redirect handling and requests-style keyword arguments against a local server.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+import allure
+from src.core.api_client import APIClient, _pretty
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Redirects /redirect to /ok and echoes the path and body of anything else"""
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        if self.path.startswith("/redirect"):
+            self.send_response(302)
+            self.send_header("Location", "/ok")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.dumps({
+            "path": self.path,
+            "body": self.rfile.read(length).decode()
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    do_POST = do_GET
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """Base URL of a local HTTP server, running for the module"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server_url):
+    """API client pointed at the local server"""
+    with APIClient(base_url=server_url, max_retries=0) as client:
+        yield client
+
+
+@allure.epic("Unit Testing")
+@allure.feature("API Client")
+@allure.story("Redirects and Keyword Arguments")
+class TestAPIClientRedirects:
+    """Test class for requests-compatible redirect handling"""
+    
+    @allure.title("Test redirects are followed by default")
+    @pytest.mark.unit
+    def test_follows_redirects(self, client):
+        """Test that a 302 is followed like requests did"""
+        response = client.get("redirect")
+        
+        assert response.status_code == 200
+        assert response.json()["path"] == "/ok"
+    
+    @allure.title("Test allow_redirects=False returns the redirect")
+    @pytest.mark.unit
+    def test_allow_redirects_false(self, client):
+        """Test that the requests-style keyword is honoured and a 3xx is not an error"""
+        response = client.get("redirect", allow_redirects=False)
+        
+        assert response.status_code == 302
+        assert response.headers["Location"] == "/ok"
+    
+    @allure.title("Test raw string data is sent as the body")
+    @pytest.mark.unit
+    def test_raw_data(self, client):
+        """Test that a str data= payload is sent as content"""
+        response = client.post("echo", data="raw body")
+        
+        assert response.json()["body"] == "raw body"
+    
+    @allure.title("Test client-level options are rejected per request")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("option", ["verify", "cert", "proxies", "stream", "hooks"])
+    def test_client_only_kwargs_rejected(self, client, option):
+        """Test that requests-only keywords fail loudly instead of being ignored"""
+        with pytest.raises(TypeError, match=option):
+            client.get("ok", **{option: None})
+
+
+@allure.epic("Unit Testing")
+@allure.feature("API Client")
+@allure.story("Debug Logging")
+class TestDebugFormatting:
+    """Test class for the debug body formatter"""
+    
+    @allure.title("Test bodies are pretty-printed with sorted keys")
+    @pytest.mark.unit
+    def test_sorted(self):
+        """Test that keys are sorted and indented"""
+        assert _pretty({"b": 1, "a": [2]}) == '{\n  "a": [\n    2\n  ],\n  "b": 1\n}'
+    
+    @allure.title("Test unsortable bodies are still formatted")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("body", [
+        {1: "int key", "b": "str key"},
+        {"big": 2 ** 70, 3: None}
+    ])
+    def test_mixed_keys(self, body):
+        """Test that bodies orjson rejects and json cannot sort don't raise"""
+        assert json.loads(_pretty(body)) == json.loads(json.dumps(body))
+
+
+
+@allure.epic("Unit Testing")
+@allure.feature("API Client")
+@allure.story("Postman Import")
+class TestPostmanImport:
+    """Test class for Postman collection import"""
+    
+    @pytest.fixture
+    def collection_path(self, tmp_path):
+        """Postman collection with a single request"""
+        path = tmp_path / "collection.json"
+        path.write_text(json.dumps({"item": [{
+            "name": "Get user",
+            "request": {
+                "method": "GET",
+                "url": {"raw": "https://api.example.com/users/1"},
+                "header": [{"key": "Accept", "value": "application/json"}]
+            },
+            "event": [{"listen": "test"}]
+        }]}), encoding="utf-8")
+        return str(path)
+    
+    @allure.title("Test the list import returns plain dicts")
+    @pytest.mark.unit
+    def test_import_list_returns_dicts(self, client, collection_path):
+        """Test that postman_import_list keeps the original dict format"""
+        tests = client.postman_import_list(collection_path)
+        
+        assert tests == [{
+            "name": "Get user",
+            "method": "GET",
+            "url": "https://api.example.com/users/1",
+            "headers": [{"key": "Accept", "value": "application/json"}],
+            "body": {},
+            "tests": [{"listen": "test"}]
+        }]
+    
+    @allure.title("Test imported dicts don't share state with the cached collection")
+    @pytest.mark.unit
+    def test_import_list_is_independent(self, client, collection_path):
+        """Test that editing an imported test case leaves later imports unchanged"""
+        client.postman_import_list(collection_path)[0]["headers"].append({"key": "X-Test"})
+        
+        assert len(client.postman_import_list(collection_path)[0]["headers"]) == 1
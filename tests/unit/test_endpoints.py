@@ -0,0 +1,115 @@
+"""
+API endpoint configuration unit tests.
+Tests URL building and the OpenAPI export without a live API.
+"""
+import json
+import pytest
+import allure
+from src.api.endpoints import APIEndpoints
+
+
+@pytest.fixture
+def endpoints():
+    """Endpoint configuration with a fixed base URL"""
+    return APIEndpoints(base_url="https://api.example.com")
+
+
+@allure.epic("Unit Testing")
+@allure.feature("API Endpoints")
+@allure.story("URL Building")
+class TestURLBuilding:
+    """Test class for memoized URL building"""
+    
+    @allure.title("Test path placeholders and query parameters are filled")
+    @pytest.mark.unit
+    def test_path_and_query(self, endpoints):
+        """Test that path params are substituted and the rest become the query string"""
+        url = endpoints.get_url("get_user", user_id=7, expand="roles")
+        
+        assert url == "https://api.example.com/api/v1/users/7?expand=roles"
+    
+    @allure.title("Test equal values of different types get their own URL")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("first,second,first_query,second_query", [
+        (True, 1, "active=True", "active=1"),
+        (1.0, 1, "active=1.0", "active=1"),
+        (0, False, "active=0", "active=False")
+    ])
+    def test_cache_keeps_value_types_apart(self, endpoints, first, second, first_query, second_query):
+        """Test that values comparing equal do not share a memoized URL"""
+        assert endpoints.get_url("get_users", active=first).endswith(f"?{first_query}")
+        assert endpoints.get_url("get_users", active=second).endswith(f"?{second_query}")
+        assert endpoints.get_url("get_users", active=first).endswith(f"?{first_query}")
+    
+    @allure.title("Test unhashable parameter values still build a URL")
+    @pytest.mark.unit
+    def test_unhashable_params(self, endpoints):
+        """Test that list values bypass the cache and are encoded per item"""
+        url = endpoints.get_url("get_users", role=["admin", "user"])
+        
+        assert url.endswith("?role=admin&role=user")
+
+
+@allure.epic("Unit Testing")
+@allure.feature("API Endpoints")
+@allure.story("OpenAPI Export")
+class TestOpenAPIExport:
+    """Test class for the cached OpenAPI export"""
+    
+    @allure.title("Test the export returns a plain, serializable dict")
+    @pytest.mark.unit
+    def test_export_is_dict(self, endpoints, tmp_path):
+        """Test that the returned spec matches the written file and can be re-serialized"""
+        path = tmp_path / "spec.json"
+        
+        spec = endpoints.export_to_openapi(str(path))
+        
+        assert type(spec) is dict
+        assert json.loads(json.dumps(spec)) == json.loads(path.read_bytes())
+    
+    @allure.title("Test mutating an export does not leak into later exports")
+    @pytest.mark.unit
+    def test_export_is_independent(self, endpoints, tmp_path):
+        """Test that callers can modify the returned spec without touching the cache"""
+        path = str(tmp_path / "spec.json")
+        spec = endpoints.export_to_openapi(path)
+        operation = spec["paths"]["/api/v1/users/{user_id}"]["get"]
+        operation["security"].append({"apiKey": []})
+        operation["responses"]["404"]["description"] = "changed"
+        spec["info"]["title"] = "changed"
+        
+        for fresh in (endpoints.export_to_openapi(path), APIEndpoints().export_to_openapi(path)):
+            operation = fresh["paths"]["/api/v1/users/{user_id}"]["get"]
+            assert operation["security"] == [{"bearerAuth": []}]
+            assert operation["responses"]["404"] == {"description": "Error"}
+            assert fresh["info"]["title"] == "Test API Specification"
+
+    
+    @allure.title("Test operations do not share security requirements")
+    @pytest.mark.unit
+    def test_operations_do_not_share_security(self, endpoints):
+        """Test that every authenticated operation gets its own security list"""
+        operations = [
+            operation
+            for _, path_item in endpoints._iter_openapi_paths()
+            for operation in path_item.values()
+            if "security" in operation
+        ]
+        operations[0]["security"].append({"apiKey": []})
+        
+        assert len(operations) > 1
+        assert all(operation["security"] == [{"bearerAuth": []}] for operation in operations[1:])
+
+    
+    @allure.title("Test operations do not share response objects")
+    @pytest.mark.unit
+    def test_operations_do_not_share_responses(self, endpoints):
+        """Test that editing one operation's error response leaves the others alone"""
+        operations = [
+            operation
+            for _, path_item in endpoints._iter_openapi_paths()
+            for operation in path_item.values()
+        ]
+        operations[0]["responses"]["500"]["description"] = "changed"
+        
+        assert all(operation["responses"]["500"] == {"description": "Error"} for operation in operations[1:])
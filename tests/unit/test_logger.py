@@ -0,0 +1,95 @@
+"""
+Logger unit tests.
+Tests that queued records are written as they were at the time of logging.
+"""
+import json
+import time
+import uuid
+import pytest
+import allure
+from src.core.logger import TestLogger
+
+
+@pytest.fixture
+def test_logger(tmp_path):
+    """Logger writing to a temporary directory; its handlers are released after the test"""
+    log = TestLogger(f"unit_{uuid.uuid4().hex}", log_dir=str(tmp_path), level="DEBUG")
+    yield log
+    log.clear_handlers()
+
+
+def _read_logs(log):
+    """Flush the listener and return the text and JSON log lines"""
+    text_path = log.get_log_file_path("file")
+    json_path = log.get_log_file_path("json")
+    log.clear_handlers()
+    text_lines = text_path.read_text(encoding="utf-8").splitlines()
+    json_lines = [json.loads(line) for line in json_path.read_text(encoding="utf-8").splitlines()]
+    return text_lines, json_lines
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Logging")
+@allure.story("Queued Records")
+class TestQueuedRecords:
+    """Test class for records handed to the background listener"""
+    
+    @allure.title("Test messages are rendered when logged")
+    @pytest.mark.unit
+    def test_args_snapshot(self, test_logger):
+        """Test that mutating a logged argument does not change earlier lines"""
+        state = {"step": 1}
+        for _ in range(3):
+            test_logger.info("state %s", state)
+            state["step"] += 1
+        
+        text_lines, json_lines = _read_logs(test_logger)
+        
+        assert [line.rsplit(" - ", 1)[-1] for line in text_lines] == [
+            "state {'step': 1}", "state {'step': 2}", "state {'step': 3}"
+        ]
+        assert [entry["message"] for entry in json_lines] == [
+            "state {'step': 1}", "state {'step': 2}", "state {'step': 3}"
+        ]
+    
+    @allure.title("Test extra fields are copied when logged")
+    @pytest.mark.unit
+    def test_extra_snapshot(self, test_logger):
+        """Test that mutating an extra= value does not change earlier JSON entries"""
+        details = {"attempt": 1}
+        for _ in range(2):
+            test_logger.info("retrying", details=details)
+            details["attempt"] += 1
+        
+        _, json_lines = _read_logs(test_logger)
+        
+        assert [entry["details"] for entry in json_lines] == [{"attempt": 1}, {"attempt": 2}]
+    
+    @allure.title("Test tracebacks are still written")
+    @pytest.mark.unit
+    def test_exception_traceback(self, test_logger):
+        """Test that exc_info survives the queue for both formatters"""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            test_logger.exception("failed")
+        
+        text_lines, json_lines = _read_logs(test_logger)
+        
+        assert "ValueError: boom" in text_lines[-1]
+        assert "ValueError: boom" in json_lines[0]["exception"]
+    
+    @allure.title("Test warnings reach the log file without waiting for the buffer")
+    @pytest.mark.unit
+    def test_warning_flushes(self, test_logger):
+        """Test that a WARNING is written before the buffer fills or closes"""
+        test_logger.info("routine")
+        test_logger.warning("attention")
+        path = test_logger.get_log_file_path("file")
+        
+        deadline = time.monotonic() + 5
+        while "attention" not in path.read_text(encoding="utf-8") and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        assert "routine" in path.read_text(encoding="utf-8")
+        assert "attention" in path.read_text(encoding="utf-8")
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+Schema validation unit tests.
+Tests format assertion and multi-schema matching without a live API.
+"""
+import copy
+import json
+import pytest
+import allure
+from src.api.schemas import SchemaValidator
+
+
+@pytest.fixture
+def user_data():
+    """Valid user document built from the schema's own example"""
+    return SchemaValidator.generate_schema_example("user")
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Schema Validation")
+@allure.story("Format Assertion")
+class TestFormatAssertion:
+    """Test class for opt-in "format" checking"""
+    
+    @allure.title("Test formats are annotations by default")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("field,value", [
+        ("email", "not-an-email"),
+        ("created_at", "yesterday")
+    ])
+    def test_formats_not_asserted_by_default(self, user_data, field, value):
+        """Test that malformed formatted strings pass unless formats are asserted"""
+        user_data[field] = value
+        
+        assert SchemaValidator.is_valid("user", user_data)
+        assert SchemaValidator.validate("user", user_data)["valid"]
+    
+    @allure.title("Test formats are asserted on request")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("field,value", [
+        ("email", "not-an-email"),
+        ("created_at", "yesterday")
+    ])
+    def test_formats_asserted_when_enabled(self, user_data, field, value):
+        """Test that validate_formats=True rejects malformed formatted strings"""
+        user_data[field] = value
+        
+        assert not SchemaValidator.is_valid("user", user_data, validate_formats=True)
+        result = SchemaValidator.validate("user", user_data, validate_formats=True)
+        assert not result["valid"]
+        assert result["errors"][0]["path"] == [field]
+    
+    @allure.title("Test well-formed values pass format assertion")
+    @pytest.mark.unit
+    def test_valid_formats_pass(self, user_data):
+        """Test that the generated example satisfies every format"""
+        assert SchemaValidator.is_valid("user", user_data, validate_formats=True)
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Schema Validation")
+@allure.story("Multiple Schemas")
+class TestValidateMultiple:
+    """Test class for SchemaValidator.validate_multiple"""
+    
+    @allure.title("Test results cover every schema tried up to the match")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_results_up_to_match(self, parallel):
+        """Test all_results holds each tried schema, in the caller's order"""
+        order = SchemaValidator.generate_schema_example("order")
+        schemas = ["user", "error", "order", "metrics"]
+        
+        result = SchemaValidator.validate_multiple(order, schemas, parallel=parallel)
+        
+        assert result["valid"]
+        assert result["matched_schema"] == "order"
+        assert list(result["all_results"]) == ["user", "error", "order"]
+        assert not result["all_results"]["user"]["valid"]
+        assert result["all_results"]["user"]["errors"]
+        assert result["all_results"]["order"] == {"valid": True, "errors": [], "schema": "order"}
+    
+    @allure.title("Test no match reports every schema")
+    @pytest.mark.unit
+    def test_no_match(self):
+        """Test that every candidate gets an error entry when nothing matches"""
+        result = SchemaValidator.validate_multiple({"unexpected": True}, ["user", "order"])
+        
+        assert not result["valid"]
+        assert result["matched_schema"] is None
+        assert list(result["all_results"]) == ["user", "order"]
+        assert all(entry["errors"] for entry in result["all_results"].values())
+    
+    @allure.title("Test only an explicit hint changes the order")
+    @pytest.mark.unit
+    def test_hint_reorders(self):
+        """Test that hint= is tried first and nothing else is reordered"""
+        order = SchemaValidator.generate_schema_example("order")
+        
+        hinted = SchemaValidator.validate_multiple(order, ["user", "order"], hint="order")
+        assert list(hinted["all_results"]) == ["order"]
+        
+        unhinted = SchemaValidator.validate_multiple(order, ["user", "order"])
+        assert list(unhinted["all_results"]) == ["user", "order"]
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Schema Validation")
+@allure.story("Schema Registry")
+class TestSchemaRegistry:
+    """Test class for schema lookup"""
+    
+    @allure.title("Test registry schemas are read-only")
+    @pytest.mark.unit
+    def test_get_schema_is_frozen(self):
+        """Test that the shared registry entry can't be modified"""
+        with pytest.raises(TypeError):
+            SchemaValidator.get_schema("user")["type"] = "array"
+    
+    @allure.title("Test the plain-dict accessor returns an editable copy")
+    @pytest.mark.unit
+    def test_get_schema_dict(self):
+        """Test that get_schema_dict can be serialized, copied and modified independently"""
+        schema = SchemaValidator.get_schema_dict("user")
+        
+        assert json.loads(json.dumps(schema)) == schema
+        assert copy.deepcopy(schema) == schema
+        schema["properties"]["email"]["format"] = "changed"
+        assert SchemaValidator.get_schema_dict("user")["properties"]["email"]["format"] == "email"
@@ -0,0 +1,173 @@
+"""
+Settings unit tests.
+Tests environment loading, immutability and JSON round-trips of TestSettings.
+"""
+import dataclasses
+import pytest
+import allure
+from config import settings as settings_module
+from config.settings import BrowserType, EnvironmentType, TestSettings, reload_env
+
+
+@pytest.fixture
+def environ(monkeypatch):
+    """monkeypatch for environment variables; the snapshot is rebuilt after the test"""
+    yield monkeypatch
+    monkeypatch.undo()
+    reload_env()
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Settings")
+@allure.story("Environment Loading")
+class TestEnvironmentLoading:
+    """Test class for reading TestSettings from the environment snapshot"""
+    
+    @allure.title("Test settings are read from the environment")
+    @pytest.mark.unit
+    def test_values_from_environment(self, environ):
+        """Test that strings, ints, bools and enums are converted from the environment"""
+        environ.setenv("ENVIRONMENT", "staging")
+        environ.setenv("BROWSER", "firefox")
+        environ.setenv("BROWSER_TIMEOUT", "45")
+        environ.setenv("HEADLESS", "False")
+        environ.setenv("BASE_URL", "https://env.example.com")
+        reload_env()
+        
+        test_settings = TestSettings()
+        
+        assert test_settings.environment == EnvironmentType.STAGING
+        assert test_settings.browser == BrowserType.FIREFOX
+        assert test_settings.browser_timeout == 45
+        assert test_settings.headless is False
+        assert test_settings.base_url == "https://env.example.com"
+    
+    @allure.title("Test defaults apply when variables are unset")
+    @pytest.mark.unit
+    def test_defaults(self, environ):
+        """Test that unset variables fall back to their defaults"""
+        for key in ("ENVIRONMENT", "BROWSER_TIMEOUT", "HEADLESS"):
+            environ.delenv(key, raising=False)
+        reload_env()
+        
+        test_settings = TestSettings()
+        
+        assert test_settings.environment == EnvironmentType.QA
+        assert test_settings.browser_timeout == 30
+        assert test_settings.headless is True
+    
+    @allure.title("Test the environment is only re-read by reload_env")
+    @pytest.mark.unit
+    def test_snapshot_until_reload(self, environ):
+        """Test that changes to os.environ are picked up only after reload_env()"""
+        environ.setenv("API_TIMEOUT", "11")
+        reload_env()
+        environ.setenv("API_TIMEOUT", "22")
+        
+        assert TestSettings().api_timeout == 11
+        reload_env()
+        assert TestSettings().api_timeout == 22
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Settings")
+@allure.story("Immutability")
+class TestImmutability:
+    """Test class for the frozen, slotted TestSettings"""
+    
+    @allure.title("Test settings cannot be modified after creation")
+    @pytest.mark.unit
+    def test_frozen(self):
+        """Test that assigning a field raises and replace() builds a new instance"""
+        test_settings = TestSettings(browser_timeout=10)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            test_settings.browser_timeout = 20
+        
+        assert dataclasses.replace(test_settings, browser_timeout=20).browser_timeout == 20
+        assert test_settings.browser_timeout == 10
+        assert not hasattr(test_settings, "__dict__")
+    
+    @allure.title("Test returned capabilities can be modified safely")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("browser", list(BrowserType))
+    def test_capabilities_are_independent(self, browser):
+        """Test that mutating returned capabilities does not affect later calls"""
+        test_settings = TestSettings(browser=browser)
+        expected = test_settings.get_browser_capabilities()
+        
+        capabilities = test_settings.get_browser_capabilities()
+        capabilities["extra"] = True
+        for value in capabilities.values():
+            if isinstance(value, dict):
+                value["extra"] = True
+        
+        assert test_settings.get_browser_capabilities() == expected
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Settings")
+@allure.story("Serialization")
+class TestSerialization:
+    """Test class for saving and loading TestSettings"""
+    
+    @allure.title("Test to_dict output")
+    @pytest.mark.unit
+    def test_to_dict(self):
+        """Test that enums are stored by value and derived fields are included"""
+        test_settings = TestSettings(
+            environment=EnvironmentType.DEV, browser=BrowserType.EDGE, headless=False,
+            base_url="https://app.example.com", api_url="https://api.example.com",
+            window_width=800, window_height=600,
+            browser_timeout=5, api_timeout=6, test_timeout=7
+        )
+        
+        assert test_settings.to_dict() == {
+            "environment": "dev",
+            "browser": "edge",
+            "headless": False,
+            "base_url": "https://app.example.com",
+            "api_url": "https://api.example.com",
+            "window_size": "800x600",
+            "timeouts": {"browser": 5, "api": 6, "test": 7}
+        }
+    
+    @allure.title("Test settings survive a save/load round-trip")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, tmp_path, monkeypatch, use_orjson):
+        """Test that saved fields load back and derived keys are ignored"""
+        if use_orjson and settings_module.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(settings_module, "orjson", None)
+        path = str(tmp_path / "settings.json")
+        original = TestSettings(
+            environment=EnvironmentType.PROD, browser=BrowserType.SAFARI,
+            headless=False, base_url="https://saved.example.com"
+        )
+        
+        original.save_to_file(path)
+        loaded = TestSettings.load_from_file(path)
+        
+        assert loaded.environment == EnvironmentType.PROD
+        assert loaded.browser == BrowserType.SAFARI
+        assert loaded.headless is False
+        assert loaded.base_url == "https://saved.example.com"
+        assert loaded.to_dict()["environment"] == "prod"
+    
+    @allure.title("Test orjson and json write the same file")
+    @pytest.mark.unit
+    def test_same_layout_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the optional orjson writer matches the json fallback byte for byte"""
+        if settings_module.orjson is None:
+            pytest.skip("orjson is not installed")
+        test_settings = TestSettings()
+        fast_path = tmp_path / "fast.json"
+        plain_path = tmp_path / "plain.json"
+        
+        test_settings.save_to_file(str(fast_path))
+        monkeypatch.setattr(settings_module, "orjson", None)
+        test_settings.save_to_file(str(plain_path))
+        
+        assert fast_path.read_bytes() == plain_path.read_bytes()
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+URL configuration unit tests.
+Tests URL lookup per application type and the errors for unknown keys.
+"""
+import pytest
+import allure
+from config.urls import AppType, URLConfig
+
+
+@pytest.fixture
+def urls():
+    """URL configuration with fixed base URLs"""
+    return URLConfig(base_url="https://app.example.com/", api_url="https://api.example.com/")
+
+
+@allure.epic("Unit Testing")
+@allure.feature("URL Configuration")
+@allure.story("URL Lookup")
+class TestURLLookup:
+    """Test class for URLConfig lookups"""
+    
+    @allure.title("Test each application type uses its own base URL")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("app_type,expected", [
+        (AppType.WEB_APP, "https://app.example.com"),
+        (AppType.MOBILE_APP, "https://app.example.com/mobile"),
+        (AppType.API, "https://api.example.com"),
+        (AppType.ADMIN, "https://app.example.com/admin")
+    ])
+    def test_base_url_per_app_type(self, urls, app_type, expected):
+        """Test that base URLs are picked by application type without trailing slashes"""
+        assert urls._get_base_url(app_type) == expected
+        assert urls._get_base_url(int(app_type)) == expected
+    
+    @allure.title("Test web and API endpoints are resolved")
+    @pytest.mark.unit
+    def test_lookup(self, urls):
+        """Test that web and nested API paths resolve and are formatted with parameters"""
+        assert urls.login_page == "https://app.example.com/login.aspx"
+        assert urls.api_auth_login == "https://api.example.com/api/login"
+        assert urls.get_api_endpoint("users", "detail", id=5) == "https://api.example.com/api/users/5"
+    
+    @allure.title("Test an unknown application type is rejected")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("app_type", [7, -1, "web_app", None])
+    def test_unknown_app_type(self, urls, app_type):
+        """Test that values outside AppType raise ValueError rather than indexing errors"""
+        with pytest.raises(ValueError, match="Unknown application type"):
+            urls.get_url(app_type, "login")
+    
+    @allure.title("Test unknown endpoints are rejected")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("app_type,endpoint,message", [
+        (AppType.WEB_APP, "missing", "Unknown endpoint"),
+        (AppType.API, "auth.missing", "Unknown API endpoint"),
+        (AppType.API, "auth", "points to a category")
+    ])
+    def test_unknown_endpoint(self, urls, app_type, endpoint, message):
+        """Test that lookups of missing endpoints raise ValueError without a chained KeyError"""
+        with pytest.raises(ValueError, match=message) as exc_info:
+            urls.get_url(app_type, endpoint)
+        
+        assert exc_info.value.__context__ is None or exc_info.value.__suppress_context__
+    
+    @allure.title("Test a missing URL parameter is reported")
+    @pytest.mark.unit
+    def test_missing_parameter(self, urls):
+        """Test that formatting a path without its placeholder value raises ValueError"""
+        with pytest.raises(ValueError, match="Missing parameter"):
+            urls.get_api_endpoint("users", "detail", user_id=5)
\ No newline at end of file
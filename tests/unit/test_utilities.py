@@ -0,0 +1,125 @@
+"""
+Core utilities unit tests.
+Tests batched command execution and the optional fast file readers/writers.
+"""
+import csv
+import json
+import math
+import pytest
+import allure
+from src.core import utilities
+from src.core.utilities import FileHandler, TestUtilities
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Utilities")
+@allure.story("Batched Commands")
+class TestCommandBatch:
+    """Test class for TestUtilities.execute_commands_batch"""
+    
+    @allure.title("Test each command gets its own result")
+    @pytest.mark.unit
+    def test_output_split_per_command(self):
+        """Test that stdout, stderr and exit codes are split at command boundaries"""
+        results = TestUtilities.execute_commands_batch([
+            ["echo", "first"],
+            ["sh", "-c", "echo second; echo oops >&2"],
+            ["printf", "no newline"]
+        ])
+        
+        assert [result["stdout"] for result in results] == ["first\n", "second\n", "no newline"]
+        assert [result["stderr"] for result in results] == ["", "oops\n", ""]
+        assert all(result["success"] and result["returncode"] == 0 for result in results)
+    
+    @allure.title("Test results match execute_command")
+    @pytest.mark.unit
+    def test_matches_single_commands(self):
+        """Test that batching gives the same result as running commands one by one"""
+        cmds = [["echo", "a b"], ["sh", "-c", "exit 3"]]
+        
+        batched = TestUtilities.execute_commands_batch(cmds, fail_fast=False)
+        single = [TestUtilities.execute_command(cmd) for cmd in cmds]
+        
+        assert batched == single
+    
+    @allure.title("Test fail_fast stops at the first failure")
+    @pytest.mark.unit
+    def test_fail_fast(self):
+        """Test that later commands are skipped after a failure"""
+        results = TestUtilities.execute_commands_batch([["true"], ["false"], ["echo", "skipped"]])
+        
+        assert [result["success"] for result in results] == [True, False]
+        assert results[1]["returncode"] == 1
+    
+    @allure.title("Test a timeout gives an error entry per command")
+    @pytest.mark.unit
+    def test_timeout(self):
+        """Test that a timed-out batch still returns one result per command"""
+        cmds = [["echo", "fast"], ["sleep", "5"], ["echo", "never"]]
+        
+        results = TestUtilities.execute_commands_batch(cmds, timeout=1)
+        
+        assert len(results) == len(cmds)
+        assert all(result["timeout"] and not result["success"] for result in results)
+
+
+@allure.epic("Unit Testing")
+@allure.feature("Utilities")
+@allure.story("File Handling")
+class TestFileHandler:
+    """Test class for FileHandler fast paths"""
+    
+    @allure.title("Test Arrow CSV reader matches csv.DictReader")
+    @pytest.mark.unit
+    @pytest.mark.parametrize("rows,encoding", [
+        ([["id", "name", "zip"], ["1", "Ann", "01234"], ["2", "", "99999"]], "utf-8"),
+        ([["id", "note"], ["1", "comma, inside"], ["2", 'quote "here"'], ["3", "multi\nline"]], "utf-8"),
+        ([["id", "value"], ["1", "NULL"], ["2", "nan"], ["3", "true"], ["4", "é ü 中"]], "utf-8"),
+        # BOM-prefixed, as saved by Excel
+        ([["id", "name"], ["1", "foo"]], "utf-8-sig")
+    ])
+    def test_read_csv_matches_dict_reader(self, tmp_path, rows, encoding):
+        """Test that every value comes back as the same string DictReader produces"""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "data.csv"
+        with open(path, "w", encoding=encoding, newline="") as f:
+            csv.writer(f).writerows(rows)
+        
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            expected = list(csv.DictReader(f))
+        
+        assert FileHandler.read_csv(str(path)) == expected
+    
+    @allure.title("Test orjson output is byte-identical to json")
+    @pytest.mark.unit
+    def test_write_json_matches_json(self, tmp_path):
+        """Test that the orjson path writes exactly what json.dump would"""
+        if utilities.orjson is None:
+            pytest.skip("orjson is not installed")
+        data = {
+            "name": "Test User",
+            "unicode": "café ✓",
+            "numbers": [1, 2.5, -3, 0.1],
+            "nested": {"empty_list": [], "empty_dict": {}, "none": None, "flag": False},
+            "rows": [{"id": 1, "tags": ["a", "b"]}]
+        }
+        path = tmp_path / "data.json"
+        
+        FileHandler.write_json(str(path), data)
+        
+        assert path.read_bytes() == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        assert FileHandler.read_json(str(path)) == data
+    
+    @allure.title("Test non-finite floats round-trip like json")
+    @pytest.mark.unit
+    def test_non_finite_floats(self, tmp_path):
+        """Test that NaN and Infinity are written and read back rather than becoming null"""
+        data = {"values": [1.5, float("inf"), float("-inf")], "nested": {"missing": float("nan")}}
+        path = tmp_path / "data.json"
+        
+        FileHandler.write_json(str(path), data)
+        
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+        loaded = FileHandler.read_json(str(path))
+        assert loaded["values"] == [1.5, float("inf"), float("-inf")]
+        assert math.isnan(loaded["nested"]["missing"])
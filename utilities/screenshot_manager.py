@@ -423,7 +423,7 @@ class ScreenshotManager:
             # Fallback to simpler similarity measure
             return 0.5
     
-    def _create_gaussian_window(self, size: int, sigma: float) -> np.ndarray:
+    def _create_gaussian_window(self, size: int, sigma: float) -> 'np.ndarray':
         """Create Gaussian window for SSIM calculation"""
         import numpy as np
         